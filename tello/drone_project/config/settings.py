@@ -17,3 +17,68 @@ MAIN_LOOP_RATE=10 # Only QT6
 
 GRID_CENTER=(300, 300)
 SAFE_DISTANCE=2
+
+# Face Detection
+FACE_DETECTOR="haar"          # "haar" | "dnn"
+FACE_DETECTION_SCALE=0.5      # detector input scale (haar)
+FACE_MIN_SIZE=(30, 30)        # in full-resolution pixels
+DNN_FACE_MODEL="local/res10_300x300_ssd_iter_140000.caffemodel"
+DNN_FACE_CONFIG="local/deploy.prototxt"
+DNN_FACE_CONFIDENCE=0.6
+
+# LightCNN
+LIGHTCNN_ARCH="LightCNN-29"   # "LightCNN-9" | "LightCNN-29" | "LightCNN-29v2" (gallery features must come from the same arch)
+
+# Frame Pipeline
+THREADED_PIPELINE=True        # capture / inference / control in their own threads
+CAPTURE_RATE=30               # max camera reads per second
+FRAME_RING_SLOTS=0            # > 0: the capture stage also publishes frames to a shared-memory FrameRing of this many slots
+FRAME_RING_SLOT_SIZE=960*720*3 # bytes per slot (a Tello frame); larger frames are not published
+
+# Inference Process
+INFERENCE_PROCESS=False       # run the tracker in a worker process (frames through shared memory)
+INFERENCE_PROCESS_TIMEOUT=2.0 # seconds without a reply before the worker is restarted
+INFERENCE_PROCESS_STARTUP=60  # seconds allowed for the worker to import and build the tracker
+
+# Latency
+LATENCY_REPORT_INTERVAL=5     # seconds between latency log lines (0 to disable)
+LATENCY_WINDOW=1000           # samples kept per stage
+
+# Flight Recorder
+RECORD_FLIGHTS=False          # also enabled with RECORD=1 in the environment
+RECORD_DIR="logs/flights"
+RECORD_CODEC="MJPG"           # intra-frame codec: cheap to encode, seekable for replay
+RECORD_QUEUE_SIZE=64          # frames buffered before the recorder starts dropping
+
+# RC Sender
+RC_SENDER=True                # send rc commands from a dedicated thread instead of controller.loop()
+RC_RATE_HZ=20                 # rc command rate
+RC_KEEPALIVE=0.5              # seconds before repeating unchanged velocities
+SIM_OUTBOX_SIZE=64            # simulator commands queued before the oldest is dropped (rc is coalesced)
+
+# Steering (GridGuide)
+CONTROL_MODE="deadzone"       # "deadzone": full error outside the safe zone | "pid": PID on the normalised error
+PID_GAINS={                   # per axis, on error / navigator limit (-1..1)
+    'x_axis': {'kp': 0.8, 'ki': 0.1, 'kd': 0.15, 'kf': 0.3},
+    'y_axis': {'kp': 0.8, 'ki': 0.1, 'kd': 0.15, 'kf': 0.3},
+    'z_axis': {'kp': 0.6, 'ki': 0.05, 'kd': 0.1, 'kf': 0.0},
+}
+PID_DERIVATIVE_TAU=0.1        # seconds, derivative low-pass
+PID_DEADBAND=0.05             # normalised output below which the axis is zeroed
+PID_FEED_FORWARD=True         # add the target velocity estimate (navigator.velocity)
+
+# Target Estimator (between tracker and GridNavigator)
+ESTIMATOR="kalman"            # "kalman" | None (raw tracker output)
+KALMAN_PROCESS_NOISE=800      # px/s^2, expected target acceleration (center)
+KALMAN_SIZE_NOISE=200         # px/s^2, expected box size change rate
+KALMAN_MEASUREMENT_NOISE=8    # px, tracker jitter
+KALMAN_MAX_COAST=0.5          # seconds of prediction without a detection before the target counts as lost
+
+# Latency Compensation
+LATENCY_COMPENSATION=True     # project the target to the expected actuation time
+ACTUATION_DELAY=0.1           # seconds from rc command to drone response
+MAX_COMPENSATION=0.5          # seconds, upper bound of the projection
+
+# Multi-resolution Tracking
+TRACK_SCALE=1.0               # trackers run on a frame downscaled by this factor (boxes are mapped back)
+TRACK_GRAYSCALE=False         # also convert to grayscale, for trackers that accept it (CSRT, LightCNN)
@@ -0,0 +1,104 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import time
+from config.settings import CAPTURE_RATE
+from object_detector.models import load_model
+from navigation_plan.navigators.GridNavigator import GridNavigator
+from flight_guide.guide.GridGuide import GridGuide
+from core.controllers.RecordingController import RecordingController
+from user_interface.interfaces.HeadlessInterface import HeadlessInterface
+
+# 
+# The "HeadlessRunner" class
+# 
+
+class HeadlessRunner:
+    """
+    Runs a tracker, GridNavigator and GridGuide on every frame of a camera
+    as fast as possible, without a window or a drone, and returns one
+    record per frame (box, navigation, command and timings).
+    """
+
+    FIELDS = (
+        'frame', 'time',
+        'x', 'y', 'w', 'h', 'cx', 'cy',
+        'loc_x', 'loc_y', 'loc_z',
+        'dir_x', 'dir_y', 'dir_z',
+        'rc_a', 'rc_b', 'rc_c', 'rc_d',
+        'model_ms', 'navigate_ms', 'guide_ms',
+    )
+
+    # 
+    # Constructor
+    # 
+
+    def __init__(self, camera, model, boundary=None, init_frame=0):
+
+        # Arguments
+        self.camera = camera
+        self.boundary = boundary
+        self.init_frame = init_frame
+
+        # Components
+        self.interface = HeadlessInterface()
+        self.interface.set_camera(camera)
+        self.model = load_model(model, self.interface) if isinstance(model, str) else model
+        self.controller = RecordingController()
+        self.navigator = GridNavigator(self.model, clock=self.source_time)
+        self.guide = GridGuide(self.navigator, self.controller, show=False)
+        self.interface.add_on_boundary(self.model.set_object)
+
+        # State
+        self.index = -1
+
+    # 
+    # Core
+    # 
+
+    def source_time(self):
+        # frames are processed faster than real time: estimate in source time
+        return self.camera.timestamp() if hasattr(self.camera, 'timestamp') else self.index / CAPTURE_RATE
+
+    def step(self):
+        """Process one frame; returns its record, or None at the end of the source."""
+        frame = self.camera.frame()
+        if frame is None: return None
+        self.index += 1
+
+        if self.index == self.init_frame and self.boundary:
+            self.interface.select_boundary(self.boundary, frame)
+
+        t0 = time.perf_counter()
+        self.model.on_frame(frame)
+        t1 = time.perf_counter()
+        self.navigator.navigate(frame)
+        t2 = time.perf_counter()
+        self.guide.loop()
+        t3 = time.perf_counter()
+
+        return self.record(frame, t0, t1, t2, t3)
+
+    def record(self, frame, t0, t1, t2, t3):
+        boundary = self.model.boundary if self.model.boundary else (None,) * 4
+        center = self.model.center if self.model.center else (None,) * 2
+        location, direction, rc = self.navigator.location, self.guide.direction, self.controller.velocities
+        timestamp = self.camera.timestamp() if hasattr(self.camera, 'timestamp') else None
+
+        return dict(zip(self.FIELDS, (
+            self.index, timestamp,
+            *boundary, *center,
+            location['x_axis'], location['y_axis'], location['z_axis'],
+            direction['x_axis'], direction['y_axis'], direction['z_axis'],
+            rc['a'], rc['b'], rc['c'], rc['d'],
+            (t1 - t0) * 1000, (t2 - t1) * 1000, (t3 - t2) * 1000,
+        )))
+
+    def run(self, max_frames=None):
+        """Yield the record of every frame until the source ends or `max_frames`."""
+        while max_frames is None or self.index + 1 < max_frames:
+            record = self.step()
+            if record is None: return
+            yield record
@@ -2,6 +2,7 @@
 # Imports
 # 
 
+import time
 import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from core.util.classes.TelloDummy import TelloDummy as Tello
 
@@ -19,6 +20,7 @@ class DummyController:
         self.tello = Tello()
         self.tello.streamon()
         self.travel = 20
+        self.latency = None # LatencyMonitor, set by the app
 
         if auto_start:
             self.start()
@@ -50,7 +52,7 @@ class DummyController:
     # The "Move"
     # 
 
-    def move(self, x_axis, y_axis, z_axis, travel=20):
+    def move(self, x_axis, y_axis, z_axis, travel=20, stamps=None):
         self.set_travel(travel)
         
         # Stop
@@ -70,6 +72,10 @@ class DummyController:
         if z_axis < 0:   self.tello.move_down(self.travel)
         elif z_axis > 0: self.tello.move_up(self.travel)
 
+        # latency
+        if self.latency and stamps:
+            self.latency.record_stamps(dict(stamps, rc=time.time()), first='control')
+
     # 
     # The "Loop"
     # 
@@ -0,0 +1,183 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import time
+from config.settings import RC_SENDER, debug
+from core.util.classes.VelocityMapper import VelocityMapper
+from core.util.classes.CommandMailbox import CommandMailbox
+from core.util.classes.RCSender import RCSender
+
+#
+# The "RCController" class
+#
+
+class RCController:
+    """
+    Shared part of the controllers that fly by rc velocities (SimController,
+    TelloControllerSmooth): `move` / `stop` map the guide's direction to
+    velocities and post them to a CommandMailbox, and the RCSender thread
+    (or `loop`) sends them. Subclasses set `SPEED` and implement
+    `rc(a, b, c, d)` and the drone calls (`takeoff`, ...).
+    """
+
+    #
+    # Config
+    #
+
+    TIMEOUT = 1
+    MIN_UPDATE_INTERVAL = 0.1
+
+    speed_factors = {
+        'x': {'low': 0.1, 'high': 1, 'scale': 1.5},
+        'y': {'low': 0.1, 'high': 1, 'scale': 1.5},
+        'z': {'low': 0.1, 'high': 1, 'scale': 1.5}
+    }
+
+    #
+    # Constructor
+    #
+
+    def __init__(self, tello, takeoff_on_start=True, use_sender=RC_SENDER):
+
+        # Arguments
+        self.tello = tello
+        if takeoff_on_start: self.takeoff()
+
+        # States
+        self.is_loop_enabled = True
+        self.is_stopped = True
+
+        # Commands from `move` / `stop`, sent by `loop`
+        self.mailbox = CommandMailbox()
+
+        # timestamps
+        self.last_send_time = 0
+        self.velocities_deadline = time.time() + self.TIMEOUT
+
+        # Latency
+        self.latency = None # LatencyMonitor, set by the app
+
+        # Velocities (last sent)
+        self.velocities = {
+            'a': 0, # Right
+            'b': 0, # Forward
+            'c': 0, # Up
+            'd': 0, # Clockwise
+        }
+
+        # Sender thread (otherwise `loop` sends)
+        self.sender = RCSender(self) if use_sender else None
+
+    #
+    # Remote Control
+    #
+
+    def stop_raw(self): self.rc(0, 0, 0, 0)
+
+    #
+    # Controls
+    #
+
+    def stop(self, immediately=False):
+        self.mailbox.post({k: 0 for k in self.velocities})
+
+        # send now instead of waiting for the loop (the sender thread sends within one tick)
+        if immediately and not self.sender: self.send(self.mailbox.take())
+
+    #
+    # Core methods
+    #
+
+    def  enable_loop(self): self.is_loop_enabled = True
+    def disable_loop(self): self.is_loop_enabled = False
+
+    #
+    # The "Move"
+    #
+
+    def move(self, x_axis, y_axis, z_axis, stamps=None):
+
+        # stop
+        if x_axis == 0 and y_axis == 0 and z_axis == 0:
+            self.mailbox.post({k: 0 for k in self.velocities}, stamps)
+            return True
+
+        # map
+        x, y, z = VelocityMapper.map_axis(x_axis, y_axis, z_axis)
+
+        # post; a command not sent yet is replaced by this one
+        self.mailbox.post({
+            'a': 0,
+            'b': VelocityMapper.calculate_speed(z, self.SPEED['z'], **self.speed_factors['z']),
+            'c': VelocityMapper.calculate_speed(y, self.SPEED['y'], **self.speed_factors['y']),
+            'd': VelocityMapper.calculate_speed(x, self.SPEED['x'], **self.speed_factors['x']),
+        }, stamps)
+        return True
+
+    #
+    # Send
+    #
+
+    def send(self, command, transmit=True):
+        if command is None: return
+
+        self.velocities = command.velocities
+        self.velocities_deadline = command.time + self.TIMEOUT
+        self.is_stopped = command.is_stop
+
+        # unchanged commands only refresh the timeout (see RCSender)
+        if not transmit: return
+
+        self.rc(**self.velocities)
+        self.last_send_time = time.time()
+        if debug: print(f"[DBG] {type(self).__name__} velocities:", self.velocities)
+
+        self.record_latency(command.stamps)
+
+    #
+    # Latency
+    #
+
+    def record_latency(self, stamps):
+        if self.latency and stamps:
+            stamps = dict(stamps, rc=time.time())
+            self.latency.record_stamps(stamps, first='control')
+
+    #
+    # The "Loop"
+    #
+
+    def check_timeout(self):
+        """Stop the drone if no command arrived for TIMEOUT seconds; True if it did."""
+        if time.time() <= self.velocities_deadline or self.is_stopped: return False
+
+        self.stop(immediately=True)
+        if debug: print("[DBG] Stop on Timeout")
+        return True
+
+    def loop(self):
+
+        # Skip if loop disabled or the sender thread owns the rc link
+        if not self.is_loop_enabled or self.sender: return
+
+        # send at most every MIN_UPDATE_INTERVAL; newer commands coalesce meanwhile
+        if time.time() - self.last_send_time < self.MIN_UPDATE_INTERVAL: return
+
+        # latest command
+        command = self.mailbox.take()
+        if command:
+            self.send(command)
+            return
+
+        self.check_timeout()
+
+    def close(self):
+        # no more commands from `loop` / the sender, and leave the drone hovering, not on its last velocities
+        self.disable_loop()
+        self.mailbox.close()
+        self.stop_raw()
+        self.velocities = {k: 0 for k in self.velocities}
+        self.is_stopped = True
+        if self.sender: self.sender.stop()
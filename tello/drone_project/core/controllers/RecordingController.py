@@ -0,0 +1,78 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import time
+from core.util.classes.VelocityMapper import VelocityMapper
+
+# 
+# The "RecordingController" class
+# 
+
+class RecordingController:
+    """
+    Controller without a drone: maps moves to rc velocities exactly like
+    TelloControllerSmooth and keeps the last command, for offline runs.
+    Every move is applied (no MIN_UPDATE_INTERVAL), since offline runs
+    are not paced in real time.
+    """
+
+    # 
+    # Config
+    # 
+
+    SPEED = {
+        'x': 30,
+        'y': 30,
+        'z': 30,
+    }
+
+    speed_factors = {
+        'x': {'low': 0.1, 'high': 1, 'scale': 1.5},
+        'y': {'low': 0.1, 'high': 1, 'scale': 1.5},
+        'z': {'low': 0.1, 'high': 1, 'scale': 1.5}
+    }
+
+    # 
+    # Constructor
+    # 
+
+    def __init__(self):
+        self.latency = None
+        self.commands = 0
+        self.velocities = {'a': 0, 'b': 0, 'c': 0, 'd': 0}
+
+    # 
+    # Controls
+    # 
+
+    def connect  (self): pass
+    def takeoff  (self): pass
+    def land     (self): pass
+    def streamon (self): pass
+    def streamoff(self): pass
+
+    def  enable_loop(self): pass
+    def disable_loop(self): pass
+
+    def stop(self, immediately=False):
+        for k in self.velocities: self.velocities[k] = 0
+        self.commands += 1
+
+    def move(self, x_axis, y_axis, z_axis, stamps=None):
+        if x_axis == 0 and y_axis == 0 and z_axis == 0:
+            self.stop(True)
+            return True
+
+        x, y, z = VelocityMapper.map_axis(x_axis, y_axis, z_axis)
+        self.velocities['b'] = VelocityMapper.calculate_speed(z, self.SPEED['z'], **self.speed_factors['z'])
+        self.velocities['c'] = VelocityMapper.calculate_speed(y, self.SPEED['y'], **self.speed_factors['y'])
+        self.velocities['d'] = VelocityMapper.calculate_speed(x, self.SPEED['x'], **self.speed_factors['x'])
+        self.commands += 1
+
+        if self.latency and stamps:
+            self.latency.record_stamps(dict(stamps, rc=time.time()), first='control')
+        return True
+
+    def loop(self): pass
@@ -1,6 +1,6 @@
 from djitellopy import Tello
 import time
-from config.settings import FRAME_SIZE, MAX_DISTANCE, debug
+from config.settings import MAX_DISTANCE, debug
 
 # 
 # Helper Class
@@ -8,7 +8,7 @@ from config.settings import FRAME_SIZE, MAX_DISTANCE, debug
 
 class TSCHelper:
     @staticmethod
-    def map_axis(x_axis: float, y_axis: float, z_axis: float, mx=FRAME_SIZE[0], my=FRAME_SIZE[1], mz=MAX_DISTANCE*2):
+    def map_axis(x_axis: float, y_axis: float, z_axis: float, mx=2, my=2, mz=MAX_DISTANCE*2):
         return \
             x_axis / mx, \
             y_axis / my, \
@@ -48,6 +48,9 @@ class TelloControllerBasic:
         self.is_changing_course = False
         self.is_stopped = True
 
+        # Latency
+        self.latency = None # LatencyMonitor, set by the app
+
         # Timestamps
         self.last_move_time = 0
         self.move_deadline = time.time() + self.TIMEOUT
@@ -81,7 +84,7 @@ class TelloControllerBasic:
     # The "Move"
     # 
     
-    def move(self, x_axis, y_axis, z_axis, travel=20):
+    def move(self, x_axis, y_axis, z_axis, travel=20, stamps=None):
 
         # current timestamp
         current_time = time.time()
@@ -109,6 +112,10 @@ class TelloControllerBasic:
         if z_axis < 0:   self.tello.move_down(travel)
         elif z_axis > 0: self.tello.move_up(travel)
 
+        # latency
+        if self.latency and stamps:
+            self.latency.record_stamps(dict(stamps, rc=time.time()), first='control')
+
         # deadline
         self.move_deadline = current_time + self.TIMEOUT
         self.is_stopped = False
@@ -0,0 +1,79 @@
+import threading
+import time
+
+#
+# The "Command" class
+#
+
+class Command:
+    """
+    An rc velocity command (`velocities` a/b/c/d), when it was issued and the
+    stage timestamps of the frame behind it (`stamps`, may be None).
+    """
+
+    __slots__ = ('seq', 'velocities', 'stamps', 'time')
+
+    def __init__(self, seq, velocities, stamps=None):
+        self.seq = seq
+        self.velocities = velocities
+        self.stamps = stamps
+        self.time = time.time()
+
+    @property
+    def is_stop(self): return not any(self.velocities.values())
+
+#
+# The "CommandMailbox" class
+#
+
+class CommandMailbox:
+    """
+    Single-slot mailbox between whoever decides the velocities (`post`, any
+    thread) and whoever sends them to the drone (`take`). Posting never blocks
+    and never fails: a newer command replaces one that was not taken yet
+    (counted in `stats['coalesced']`), so the sender always sends the latest
+    intent and nothing gets stuck behind a stale command.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.command = None
+        self.seq = 0
+        self.taken_seq = 0
+        self.closed = False
+        self.stats = {'posted': 0, 'taken': 0, 'coalesced': 0}
+
+    def post(self, velocities, stamps=None):
+        with self.condition:
+            if self.seq > self.taken_seq: self.stats['coalesced'] += 1
+            self.seq += 1
+            self.command = Command(self.seq, dict(velocities), stamps)
+            self.stats['posted'] += 1
+            self.condition.notify_all()
+            return self.seq
+
+    def take(self, timeout=0):
+        """Return the pending command (waiting up to `timeout` seconds), or None."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.seq > self.taken_seq or self.closed, timeout):
+                return None
+            if self.seq <= self.taken_seq:
+                return None
+            self.taken_seq = self.seq
+            self.stats['taken'] += 1
+            return self.command
+
+    def latest(self):
+        """The newest command, taken or not (None before the first post)."""
+        with self.condition:
+            return self.command
+
+    @property
+    def pending(self):
+        with self.condition:
+            return self.seq > self.taken_seq
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
@@ -0,0 +1,224 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+import queue
+import struct
+import threading
+import time
+import cv2
+import numpy as np
+from config.settings import RECORD_CODEC, RECORD_QUEUE_SIZE, debug
+
+#
+# Log format
+#
+# File header: MAGIC, version (u16), record size (u16).
+# Then one fixed-size little-endian record per frame; missing boxes are -1.
+#
+
+MAGIC = b'EWFR'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+
+RECORD_DTYPE = np.dtype([
+    ('time', '<f8'),                                        # capture time (epoch seconds)
+    ('frame', '<u4'),                                       # index of the frame in the video
+    ('x', '<i2'), ('y', '<i2'), ('w', '<i2'), ('h', '<i2'), # tracker box
+    ('cx', '<i2'), ('cy', '<i2'),                           # tracker center
+    ('loc_x', '<f4'), ('loc_y', '<f4'), ('loc_z', '<f4'),   # GridNavigator.location
+    ('dir_x', '<f4'), ('dir_y', '<f4'), ('dir_z', '<f4'),   # GridGuide.direction
+    ('rc_a', 'i1'), ('rc_b', 'i1'), ('rc_c', 'i1'), ('rc_d', 'i1'), # rc velocities
+])
+RECORD = struct.Struct('<dI6h6f4b')
+
+def load_flight_log(path):
+    """Read a flight log as a numpy structured array (columnar access: log['time'], log['x'], ...)."""
+    with open(path, 'rb') as f:
+        magic, version, size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a version {VERSION} flight log")
+    return np.fromfile(path, dtype=RECORD_DTYPE, offset=HEADER.size)
+
+#
+# The "FlightRecorder" class
+#
+
+class FlightRecorder:
+    """
+    Records video plus a compact binary log of tracker boxes, navigator
+    location, guide direction and rc velocities for every frame.
+    `on_frame` only snapshots state and enqueues it; encoding and disk I/O
+    happen in a background thread. The queue is bounded: when the writer
+    falls behind, frames are dropped (and counted) instead of blocking the
+    control loop or growing memory.
+
+    Frames arrive at the rate of the stage that feeds the recorder, not the
+    camera's. Without `frame_rate` the video rate is measured from the
+    capture times of the first RATE_WINDOW seconds of frames; the log keeps
+    the exact capture time of every video frame either way.
+    """
+
+    FLUSH_INTERVAL = 1
+    RATE_WINDOW = 1.0 # seconds of frames buffered to measure the frame rate
+
+    #
+    # Constructor
+    #
+
+    def __init__(self, path, frame_rate=None, codec=RECORD_CODEC, queue_size=RECORD_QUEUE_SIZE, auto_start=True):
+
+        # Arguments
+        self.video_path = f"{path}.avi"
+        self.log_path = f"{path}.bin"
+        self.frame_rate = frame_rate
+        self.codec = codec
+
+        # Sources (attach)
+        self.model = None
+        self.navigator = None
+        self.guide = None
+        self.controller = None
+
+        # State
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.writer = None
+        self.log = None
+        self.thread = None
+        self.is_running = False
+        self.pending = [] # frames buffered while the frame rate is measured
+        self.stats = {'frames': 0, 'dropped': 0, 'failed': 0}
+
+        if auto_start:
+            self.start()
+
+    def attach(self, model=None, navigator=None, guide=None, controller=None):
+        self.model = model
+        self.navigator = navigator
+        self.guide = guide
+        self.controller = controller
+
+    #
+    # Start / Stop
+    #
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.log_path) or '.', exist_ok=True)
+        self.log = open(self.log_path, 'wb')
+        self.log.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+        self.is_running = True
+        self.thread = threading.Thread(target=self.write_loop, name="flight-recorder", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None: return
+        self.is_running = False
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+        self.thread = None
+        if debug: print(f"[DBG] FlightRecorder: {self.stats['frames']} frames, {self.stats['dropped']} dropped, {self.stats['failed']} failed -> {self.log_path}")
+
+    #
+    # Capture (caller thread)
+    #
+
+    def snapshot(self, timestamp):
+        boundary = getattr(self.model, 'boundary', None) or (-1, -1, -1, -1)
+        center = getattr(self.model, 'center', None) or (-1, -1)
+        zeros = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+        location = getattr(self.navigator, 'location', zeros)
+        direction = getattr(self.guide, 'direction', zeros)
+        rc = getattr(self.controller, 'velocities', {'a': 0, 'b': 0, 'c': 0, 'd': 0})
+
+        return (
+            timestamp,
+            *(int(v) for v in boundary), *(int(v) for v in center),
+            location['x_axis'], location['y_axis'], location['z_axis'],
+            direction['x_axis'], direction['y_axis'], direction['z_axis'],
+            rc['a'], rc['b'], rc['c'], rc['d'],
+        )
+
+    def on_frame(self, frame, stamps=None):
+        if not self.is_running: return
+        timestamp = stamps['capture'] if stamps else time.time()
+        try:
+            self.queue.put_nowait((frame, self.snapshot(timestamp)))
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    #
+    # Writer (background thread)
+    #
+
+    def write_loop(self):
+        last_flush = time.time()
+        while True:
+            item = self.queue.get()
+            if item is None: break
+
+            if self.writer is None:
+                self.pending.append(item)
+                if self.measure_rate(): self.open_writer()
+            else:
+                self.write(*item)
+
+            if time.time() - last_flush > self.FLUSH_INTERVAL:
+                self.log.flush()
+                last_flush = time.time()
+
+        # recording shorter than the measuring window
+        if self.writer is None and self.pending:
+            self.measure_rate(final=True)
+            self.open_writer()
+
+        if self.writer: self.writer.release()
+        self.log.close()
+
+    def measure_rate(self, final=False):
+        """True once the frame rate is known (given, or measured over the buffered frames)."""
+        if self.frame_rate: return True
+
+        first, last = self.pending[0][1][0], self.pending[-1][1][0]
+        if last - first < self.RATE_WINDOW and not final: return False
+
+        self.frame_rate = (len(self.pending) - 1) / (last - first) if last > first else 1
+        if debug: print(f"[DBG] FlightRecorder: recording at {self.frame_rate:.1f} fps")
+        return True
+
+    def open_writer(self):
+        height, width = self.pending[0][0].shape[:2]
+        self.writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*self.codec), self.frame_rate, (width, height))
+        for item in self.pending: self.write(*item)
+        self.pending = []
+
+    def write(self, frame, snapshot):
+        """Write the video frame and its log record, or neither (counted in stats['failed'])."""
+        try:
+            timestamp, *values = snapshot
+            rc = [max(-128, min(127, int(v))) for v in values[-4:]]
+            record = RECORD.pack(timestamp, self.stats['frames'], *values[:6], *values[6:12], *rc)
+            image = frame if frame.ndim == 3 else cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        except Exception as e:
+            self.stats['failed'] += 1
+            if debug: print("[DBG] FlightRecorder: bad frame:", e)
+            return
+
+        # the record only once the video has the frame, so frame indices stay aligned
+        try:
+            self.writer.write(image)
+        except Exception as e:
+            self.stats['failed'] += 1
+            if debug: print("[DBG] FlightRecorder: video write failed:", e)
+            return
+
+        try:
+            self.log.write(record)
+        except OSError as e:
+            # the video is one frame ahead of the log now: stop rather than record misaligned data
+            self.stats['failed'] += 1
+            self.is_running = False
+            print("[ERR] FlightRecorder: log write failed, recording stopped:", e)
+            return
+        self.stats['frames'] += 1
@@ -0,0 +1,223 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+import threading
+import time
+import traceback
+import numpy as np
+from config.settings import CAPTURE_RATE, FRAME_RING_SLOTS, debug
+from core.util.classes.LatestValue import LatestValue
+from core.util.classes.LatencyMonitor import LatencyMonitor
+
+#
+# The "FramePacket" class
+#
+
+class FramePacket:
+    """
+    A captured frame, its sequence number and the time each stage finished
+    with it (`stamps`, starting with 'capture').
+    """
+
+    __slots__ = ('seq', 'image', 'stamps')
+
+    def __init__(self, seq, image):
+        self.seq = seq
+        self.image = image
+        self.stamps = {'capture': time.time()}
+
+    @property
+    def captured_at(self): return self.stamps['capture']
+
+#
+# The "FramePipeline" class
+#
+
+class FramePipeline:
+    """
+    Capture, inference and control stages, each in its own thread, connected
+    by latest-value slots: a slow stage only ever sees the newest frame and
+    never holds back the stages before it. Rendering is pulled by the
+    interface from its own thread through `render()`, so display runs at
+    the camera rate regardless of tracker speed.
+
+    With `ring_slots`, every captured frame is also published to a shared
+    memory `FrameRing` (`ring`), for consumers in other threads or
+    processes (see ProcessTracker).
+    """
+
+    STAGE_TIMEOUT = 0.5
+
+    #
+    # Constructor
+    #
+
+    def __init__(self, camera, capture_rate=CAPTURE_RATE, latency=None, auto_start=False, ring_slots=FRAME_RING_SLOTS):
+
+        # Arguments
+        self.camera = camera
+        self.capture_interval = 1 / capture_rate if capture_rate else 0
+        self.latency = latency if latency else LatencyMonitor()
+
+        # Shared frames, for any camera type
+        self.ring = None
+        if ring_slots:
+            from core.util.classes.FrameRing import FrameRing
+            self.ring = FrameRing(ring_slots)
+
+        # Slots
+        self.captured = LatestValue()
+        self.inferred = LatestValue()
+        self.controlled = LatestValue()
+
+        # Listeners
+        self.inference_listeners = []
+        self.control_listeners = []
+        self.render_listeners = []
+        self.stage_listeners = []
+
+        # Held while inference listeners run; use it to change tracker state from other threads
+        self.inference_lock = threading.Lock()
+
+        # States
+        self.is_running = False
+        self.threads = []
+        self.stats = {'captured': 0, 'inference': 0, 'control': 0, 'inference_skipped': 0, 'control_skipped': 0}
+
+        if auto_start:
+            self.start()
+
+    #
+    # Listeners
+    #
+
+    # `with_stamps` listeners are called as callback(frame, stamps=packet.stamps)
+    def add_inference_listener(self, callback, with_stamps=False): self.inference_listeners.append((callback, with_stamps))
+    def add_control_listener  (self, callback, with_stamps=False): self.control_listeners.append((callback, with_stamps))
+    def add_render_listener   (self, callback): self.render_listeners.append(callback)
+
+    # called as callback(stage, packet) from the stage's thread once 'capture', 'inference' or 'control' is done with a frame
+    def add_stage_listener(self, callback): self.stage_listeners.append(callback)
+
+    #
+    # Start / Stop
+    #
+
+    def start(self):
+        if self.is_running: return
+        self.is_running = True
+
+        self.threads = [
+            threading.Thread(target=self.capture_loop, name="pipeline-capture", daemon=True),
+            threading.Thread(target=self.stage_loop, args=("inference", self.captured, self.inferred, self.inference_listeners, self.inference_lock), name="pipeline-inference", daemon=True),
+            threading.Thread(target=self.stage_loop, args=("control", self.inferred, self.controlled, self.control_listeners, None), name="pipeline-control", daemon=True),
+        ]
+        for thread in self.threads: thread.start()
+
+    def stop(self):
+        self.is_running = False
+        for slot in (self.captured, self.inferred, self.controlled): slot.close()
+        for thread in self.threads:
+            if thread is not threading.current_thread(): thread.join(timeout=1)
+        self.threads = []
+        if self.ring:
+            self.ring.close()
+            self.ring = None
+
+    #
+    # Stages
+    #
+
+    def capture_loop(self):
+        seq = 0
+        while self.is_running:
+            started = time.time()
+            try:
+                image = self.camera.frame()
+            except Exception as e:
+                if debug: print("[DBG] Pipeline capture failed:", e)
+                image = None
+
+            if image is not None:
+                seq += 1
+                packet = FramePacket(seq, image)
+                if self.ring: self.ring.publish(image, packet.captured_at)
+                self.captured.put(packet)
+                self.stats['captured'] += 1
+                self.notify("capture", packet)
+
+            # pace camera reads
+            remaining = self.capture_interval - (time.time() - started)
+            if remaining > 0: time.sleep(remaining)
+
+    def stage_loop(self, name, source, sink, listeners, lock):
+        last_seq, last_frame = 0, 0
+        while self.is_running:
+            last_seq, packet = source.get(last_seq, self.STAGE_TIMEOUT)
+            if packet is None: continue
+
+            # frames overwritten before this stage could take them
+            if last_frame: self.stats[f'{name}_skipped'] += packet.seq - last_frame - 1
+            last_frame = packet.seq
+
+            try:
+                if lock:
+                    with lock: self.run_listeners(listeners, packet)
+                else:
+                    self.run_listeners(listeners, packet)
+            except Exception as e:
+                print(f"[ERR] Pipeline stage '{name}' failed:", e)
+                if debug: traceback.print_exc()
+
+            packet.stamps[name] = time.time()
+            self.stats[name] += 1
+            sink.put(packet)
+
+            if name == "control": self.latency.record_stamps(packet.stamps)
+            self.notify(name, packet)
+
+    def notify(self, stage, packet):
+        for callback in self.stage_listeners:
+            try:
+                callback(stage, packet)
+            except Exception as e:
+                if debug: print("[DBG] Pipeline stage listener failed:", e)
+
+    def run_listeners(self, listeners, packet):
+        for callback, with_stamps in listeners:
+            if with_stamps: callback(packet.image, stamps=packet.stamps)
+            else:           callback(packet.image)
+
+    #
+    # Render (called from the UI thread)
+    #
+
+    def latest_frame(self):
+        _, packet = self.captured.latest()
+        return None if packet is None else packet.image
+
+    def latest_seq(self):
+        """Sequence number of the newest captured frame (0 before the first)."""
+        _, packet = self.captured.latest()
+        return 0 if packet is None else packet.seq
+
+    def render(self, out=None):
+        """
+        Return a copy of the newest captured frame with the render listeners
+        applied, or None. With `out` (an array of the frame's shape, e.g. a
+        display buffer) the frame is copied into it instead of a new array.
+        """
+        image = self.latest_frame()
+        if image is None: return None
+
+        if out is not None and out.shape == image.shape:
+            np.copyto(out, image)
+            frame = out
+        else:
+            frame = image.copy()
+        for callback in self.render_listeners:
+            processed = callback(frame)
+            if processed is not None: frame = processed
+        return frame
@@ -0,0 +1,215 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+import threading
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from config.settings import FRAME_RING_SLOTS, FRAME_RING_SLOT_SIZE
+
+#
+# The "FrameRing" class
+#
+
+class FrameRing:
+    """
+    Ring of fixed-size frame slots in shared memory, written by one producer
+    (`publish`) and read by any number of consumers, in this process or in
+    others (`FrameRing.attach(name)`), each with its own cursor
+    (`FrameReader`). Frame `seq` lives in slot `seq % slots` until it is
+    overwritten `slots` frames later; the producer never waits for readers,
+    readers detect overwritten frames instead.
+
+    Layout: an int64 header (slots, slot size, head seq, closed), then per
+    slot its seq (0 while being written), shape and timestamp, then the
+    slot data. Frames are uint8, color or grayscale.
+    """
+
+    POLL_INTERVAL = 0.002 # seconds, readers in other processes poll the head
+
+    def __init__(self, slots=FRAME_RING_SLOTS, slot_size=FRAME_RING_SLOT_SIZE, name=None, create=True):
+        if create:
+            slots = max(1, int(slots))
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=self.data_offset(slots) + slots * slot_size)
+        else:
+            self.shm = attach(name)
+
+        self.owner = create
+        self.meta = np.ndarray((4,), dtype=np.int64, buffer=self.shm.buf)
+        if create: self.meta[:] = (slots, slot_size, 0, 0)
+
+        self.slots, self.slot_size = int(self.meta[0]), int(self.meta[1])
+        self.slot_seq = np.ndarray((self.slots,), dtype=np.int64, buffer=self.shm.buf, offset=32)
+        self.slot_shape = np.ndarray((self.slots, 3), dtype=np.int64, buffer=self.shm.buf, offset=32 + 8 * self.slots)
+        self.slot_time = np.ndarray((self.slots,), dtype=np.float64, buffer=self.shm.buf, offset=32 + 32 * self.slots)
+
+        # in-process readers are woken up, other processes poll
+        self.condition = threading.Condition()
+        self.sources = [None] * self.slots # published arrays, for `seq_of` (producer side)
+        self.stats = {'published': 0, 'oversized': 0}
+
+    @classmethod
+    def attach(cls, name):
+        """Open the ring `name` created by another process (or object)."""
+        return cls(name=name, create=False)
+
+    @staticmethod
+    def data_offset(slots):
+        return (32 + 40 * slots + 63) // 64 * 64
+
+    @property
+    def name(self): return self.shm.name
+
+    @property
+    def head(self): return 0 if self.meta is None else int(self.meta[2])
+
+    @property
+    def closed(self): return self.meta is None or bool(self.meta[3])
+
+    def data(self, slot, shape):
+        return np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf, offset=self.data_offset(self.slots) + slot * self.slot_size)
+
+    #
+    # Producer
+    #
+
+    def publish(self, frame, timestamp=None):
+        """Copy `frame` into the next slot; returns its seq, or 0 if it does not fit a slot."""
+        if self.meta is None: return 0 # closed
+        if frame.dtype != np.uint8 or frame.nbytes > self.slot_size:
+            self.stats['oversized'] += 1
+            return 0
+
+        seq = self.head + 1
+        slot = seq % self.slots
+        shape = frame.shape if frame.ndim == 3 else (*frame.shape, 0)
+
+        self.slot_seq[slot] = 0 # being written
+        np.copyto(self.data(slot, frame.shape), frame)
+        self.slot_shape[slot] = shape
+        self.slot_time[slot] = time.time() if timestamp is None else timestamp
+        self.slot_seq[slot] = seq
+        self.meta[2] = seq
+
+        self.sources[slot] = frame
+        self.stats['published'] += 1
+        with self.condition: self.condition.notify_all()
+        return seq
+
+    def seq_of(self, frame):
+        """The seq `frame` (the array itself) was published as, if it is still in the ring, else 0."""
+        for slot, source in enumerate(self.sources):
+            if source is frame and self.slot_seq is not None and self.slot_seq[slot]:
+                return int(self.slot_seq[slot])
+        return 0
+
+    #
+    # Consumers
+    #
+
+    def valid(self, seq):
+        """True while frame `seq` is in the ring (not overwritten)."""
+        return seq > 0 and self.slot_seq is not None and int(self.slot_seq[seq % self.slots]) == seq
+
+    def read(self, seq, copy=True):
+        """
+        Return (frame, timestamp) of frame `seq`, or (None, None) if it was
+        overwritten. Without `copy` the frame is a view of the slot: it stays
+        valid only while `valid(seq)` is true.
+        """
+        if not self.valid(seq): return None, None
+
+        slot = seq % self.slots
+        height, width, channels = (int(v) for v in self.slot_shape[slot])
+        timestamp = float(self.slot_time[slot])
+        frame = self.data(slot, (height, width, channels) if channels else (height, width))
+        if copy: frame = frame.copy()
+
+        # the producer may have started on the slot meanwhile
+        if not self.valid(seq): return None, None
+        return frame, timestamp
+
+    def latest(self, copy=True):
+        """(seq, frame, timestamp) of the newest frame, or (0, None, None)."""
+        seq = self.head
+        frame, timestamp = self.read(seq, copy)
+        return (seq, frame, timestamp) if frame is not None else (0, None, None)
+
+    def wait(self, after, timeout=None):
+        """Wait until a frame newer than `after` is published; returns the head seq."""
+        deadline = None if timeout is None else time.time() + timeout
+        while self.head <= after and not self.closed:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0: break
+            interval = self.POLL_INTERVAL if remaining is None else min(self.POLL_INTERVAL, remaining)
+            if self.owner:
+                with self.condition: self.condition.wait_for(lambda: self.head > after or self.closed, interval)
+            else:
+                time.sleep(interval)
+        return self.head
+
+    def reader(self, latest=True):
+        return FrameReader(self, latest)
+
+    def close(self):
+        """Detach; the creating object also marks the ring closed and frees it."""
+        if self.owner:
+            self.meta[3] = 1
+            with self.condition: self.condition.notify_all()
+        self.sources = [None] * self.slots
+        self.meta = self.slot_seq = self.slot_shape = self.slot_time = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass # views handed out with copy=False are still alive; the mapping goes with them
+        if self.owner: self.shm.unlink()
+
+#
+# The "FrameReader" class
+#
+
+class FrameReader:
+    """
+    A consumer's cursor on a FrameRing. With `latest` (default) `next`
+    returns the newest frame after the cursor, like the pipeline stages;
+    otherwise every frame in order, skipping only the ones already
+    overwritten. Skipped frames are counted in `stats['dropped']`.
+    """
+
+    def __init__(self, ring, latest=True):
+        self.ring = ring
+        self.latest = latest
+        self.cursor = ring.head # only frames published from now on
+        self.stats = {'read': 0, 'dropped': 0}
+
+    def next(self, timeout=None, copy=True):
+        """Return (seq, frame, timestamp), or (0, None, None) on timeout / close."""
+        while True:
+            head = self.ring.wait(self.cursor, timeout)
+            if head <= self.cursor: return 0, None, None
+
+            # oldest frame still in the ring
+            seq = head if self.latest else max(self.cursor + 1, head - self.ring.slots + 1)
+            frame, timestamp = self.ring.read(seq, copy)
+
+            self.stats['dropped'] += seq - self.cursor - 1
+            self.cursor = seq
+            if frame is None:
+                self.stats['dropped'] += 1
+                continue
+
+            self.stats['read'] += 1
+            return seq, frame, timestamp
+
+#
+# Helpers
+#
+
+def attach(name):
+    # the creator owns (and unlinks) the block; Python < 3.13 has no `track` and tracks it here too
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
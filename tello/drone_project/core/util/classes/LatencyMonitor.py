@@ -0,0 +1,99 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+import threading
+import time
+from collections import deque
+from config.settings import LATENCY_REPORT_INTERVAL, LATENCY_WINDOW
+
+#
+# The "LatencyMonitor" class
+#
+
+class LatencyMonitor:
+    """
+    Collects per-stage latencies from the timestamps carried with each frame
+    ('capture' -> 'inference' -> 'control' -> 'guide' -> 'rc') and logs
+    p50/p95/p99 over a sliding window every `report_interval` seconds.
+    """
+
+    STAGES = ('capture', 'inference', 'control', 'guide', 'rc')
+
+    def __init__(self, report_interval=LATENCY_REPORT_INTERVAL, window=LATENCY_WINDOW):
+        self.report_interval = report_interval
+        self.window = window
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.last_report = time.time()
+
+    #
+    # Recording
+    #
+
+    def record(self, name, seconds):
+        with self.lock:
+            if name not in self.samples: self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(seconds)
+
+    def record_stamps(self, stamps, first='capture'):
+        """
+        Record the delta of every consecutive pair of stages present in
+        `stamps` from `first` on, and the capture to rc total when complete.
+        """
+        stages = self.STAGES[self.STAGES.index(first):]
+        present = [stage for stage in stages if stage in stamps]
+        for previous, stage in zip(present, present[1:]):
+            self.record(f"{previous}->{stage}", stamps[stage] - stamps[previous])
+        if 'capture' in stamps and 'rc' in stamps:
+            self.record("photon->rc", stamps['rc'] - stamps['capture'])
+
+        self.maybe_report()
+
+    #
+    # Statistics
+    #
+
+    @staticmethod
+    def percentile(values, q):
+        index = min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))
+        return values[index]
+
+    def summary(self):
+        """Return {name: {'count', 'p50', 'p95', 'p99', 'max'}} in milliseconds."""
+        with self.lock:
+            snapshot = {name: sorted(values) for name, values in self.samples.items() if values}
+
+        return {
+            name: {
+                'count': len(values),
+                'p50': self.percentile(values, 50) * 1000,
+                'p95': self.percentile(values, 95) * 1000,
+                'p99': self.percentile(values, 99) * 1000,
+                'max': values[-1] * 1000,
+            }
+            for name, values in snapshot.items()
+        }
+
+    def get(self, name, q=50):
+        """Percentile of one stage in seconds, or None without samples."""
+        with self.lock:
+            values = sorted(self.samples.get(name, ()))
+        return self.percentile(values, q) if values else None
+
+    #
+    # Reporting
+    #
+
+    def format(self):
+        return " | ".join(
+            f"{name} p50={s['p50']:.1f} p95={s['p95']:.1f} p99={s['p99']:.1f}ms"
+            for name, s in self.summary().items()
+        )
+
+    def maybe_report(self):
+        if not self.report_interval or time.time() - self.last_report < self.report_interval: return
+        self.last_report = time.time()
+        line = self.format()
+        if line: print("[LAT]", line)
@@ -0,0 +1,43 @@
+import threading
+
+# 
+# The "LatestValue" class
+# 
+
+class LatestValue:
+    """
+    Bounded single-slot queue with latest-value semantics.
+    `put` never blocks and overwrites any value that was not consumed yet;
+    readers wait for a sequence number newer than the one they last saw.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.value = None
+        self.seq = 0
+        self.closed = False
+
+    def put(self, value):
+        with self.condition:
+            self.value = value
+            self.seq += 1
+            self.condition.notify_all()
+            return self.seq
+
+    def get(self, after=0, timeout=None):
+        """Wait for a value newer than `after`; returns (seq, value) or (after, None) on timeout/close."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.seq > after or self.closed, timeout):
+                return after, None
+            if self.seq <= after:
+                return after, None
+            return self.seq, self.value
+
+    def latest(self):
+        with self.condition:
+            return self.seq, self.value
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
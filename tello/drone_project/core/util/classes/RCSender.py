@@ -0,0 +1,109 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+import threading
+import time
+from config.settings import RC_RATE_HZ, RC_KEEPALIVE, debug
+from core.util.classes.LatencyMonitor import LatencyMonitor
+
+#
+# The "RCSender" class
+#
+
+class RCSender(threading.Thread):
+    """
+    Sends a controller's rc commands from its own thread at a fixed rate,
+    independent of UI load. Every tick takes the newest command from the
+    controller's mailbox; it is transmitted only if the velocities changed,
+    or if nothing was sent for `keepalive` seconds. Tick lateness and the
+    interval between ticks are kept as jitter statistics (`summary()`).
+    """
+
+    def __init__(self, controller, rate=RC_RATE_HZ, keepalive=RC_KEEPALIVE, auto_start=True):
+        super().__init__(name="rc-sender", daemon=True)
+
+        # Arguments
+        self.controller = controller
+        self.period = 1 / rate
+        self.keepalive = keepalive
+
+        # States
+        self.is_running = False
+        self.last_tick = None
+        self.jitter = LatencyMonitor(report_interval=0)
+        self.stats = {'ticks': 0, 'sent': 0, 'unchanged': 0, 'keepalive': 0, 'overruns': 0}
+
+        if auto_start:
+            self.start()
+
+    #
+    # Start / Stop
+    #
+
+    def start(self):
+        self.is_running = True
+        super().start()
+
+    def stop(self):
+        if not self.is_running: return
+        self.is_running = False
+        if self is not threading.current_thread(): self.join(timeout=1)
+        if debug: print("[DBG] RCSender:", self.stats, self.format())
+
+    #
+    # Loop
+    #
+
+    def run(self):
+        scheduled = time.perf_counter()
+        while self.is_running:
+            now = time.perf_counter()
+            self.jitter.record("lateness", now - scheduled)
+            if self.last_tick is not None: self.jitter.record("interval", now - self.last_tick)
+            self.last_tick = now
+
+            try:
+                self.tick()
+            except Exception as e:
+                print("[ERR] RCSender:", e)
+
+            # fixed cadence; skip ticks that were missed instead of bursting
+            scheduled += self.period
+            now = time.perf_counter()
+            if scheduled < now:
+                self.stats['overruns'] += 1
+                scheduled = now + self.period
+            time.sleep(scheduled - now)
+
+    def tick(self):
+        controller = self.controller
+        self.stats['ticks'] += 1
+        if not controller.is_loop_enabled: return
+
+        command = controller.mailbox.take()
+        if command:
+            changed = command.velocities != controller.velocities
+            controller.send(command, transmit=changed)
+            self.stats['sent' if changed else 'unchanged'] += 1
+            if changed: return
+
+        if controller.check_timeout(): return
+
+        # keepalive
+        if time.time() - controller.last_send_time >= self.keepalive:
+            controller.rc(**controller.velocities)
+            controller.last_send_time = time.time()
+            self.stats['keepalive'] += 1
+
+    #
+    # Statistics
+    #
+
+    def summary(self):
+        """Return {'lateness': {...}, 'interval': {...}} in milliseconds (see LatencyMonitor.summary)."""
+        return self.jitter.summary()
+
+    def format(self):
+        return self.jitter.format()
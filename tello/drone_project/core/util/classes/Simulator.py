@@ -1,13 +1,33 @@
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
 import asyncio
 import websockets
 import json
 import threading
+from collections import deque
+from config.settings import SIM_OUTBOX_SIZE, debug
 
 class Simulator:
-    def __init__(self, run_on_start=True):
+    """
+    WebSocket bridge to the simulator. Outgoing commands are fire-and-forget:
+    callers only queue them (`post`, `post_rc`) and the event loop sends
+    everything queued in one flush. Only the newest rc command waits to be
+    sent (older ones are coalesced), other commands keep their order, and
+    when the outbox is full the oldest one is dropped. See `stats`.
+    """
+
+    def __init__(self, run_on_start=True, outbox_size=SIM_OUTBOX_SIZE):
         self.connection = None
         self.loop = asyncio.new_event_loop()  # Create a new event loop
         self.lock = threading.Lock()  # For thread-safe operations
+
+        # Outbound queue, flushed by `flush_loop`
+        self.outbox = deque()
+        self.outbox_size = outbox_size
+        self.pending_rc = None
+        self.wake = None            # asyncio.Event, created by `flush_loop`
+        self.is_flush_scheduled = False
+        self.stats = {'queued': 0, 'sent': 0, 'coalesced': 0, 'dropped': 0, 'flushes': 0}
+
         if run_on_start:
             self.start_server()  # Start the server in a separate thread
 
@@ -23,6 +43,7 @@ class Simulator:
         self.loop.run_until_complete(self.run_websocket_server(port))
 
     async def run_websocket_server(self, port):
+        self.loop.create_task(self.flush_loop())
         async with websockets.serve(self.handle_connection, "0.0.0.0", port):
             print(f"Simulator listening on ws://0.0.0.0:{port}")
             await asyncio.Future()  # Run forever
@@ -49,45 +70,118 @@ class Simulator:
         if self.connection:
             await self.connection.send(json.dumps(message))
 
-    def execute_in_loop(self, coro):
-        """Helper to execute a coroutine in the event loop from outside."""
-        with self.lock:  # Ensure thread-safe access to the loop
-            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
-
-    # Wrappers for external calls without needing async/await
+    # Outbound queue (any thread)
+    def post(self, message):
+        """Queue a command; never blocks. A pending rc command is sent before it."""
+        with self.lock:
+            if self.pending_rc is not None:
+                self.append(self.pending_rc)
+                self.pending_rc = None
+            self.append(message)
+        self.schedule_flush()
+
+    def post_rc(self, message):
+        """Queue an rc command, replacing one that was not sent yet."""
+        with self.lock:
+            if self.pending_rc is not None: self.stats['coalesced'] += 1
+            self.pending_rc = message
+            self.stats['queued'] += 1
+        self.schedule_flush()
+
+    def append(self, message):
+        # with self.lock
+        if len(self.outbox) >= self.outbox_size:
+            self.outbox.popleft()
+            self.stats['dropped'] += 1
+        self.outbox.append(message)
+        self.stats['queued'] += 1
+
+    def schedule_flush(self):
+        # wake the flusher once per batch, not once per message
+        with self.lock:
+            if self.is_flush_scheduled or self.wake is None: return
+            self.is_flush_scheduled = True
+        self.loop.call_soon_threadsafe(self.wake.set)
+
+    async def flush_loop(self):
+        # commands posted before the loop started are flushed right away
+        with self.lock:
+            self.wake = asyncio.Event()
+            self.is_flush_scheduled = bool(self.outbox) or self.pending_rc is not None
+        if self.is_flush_scheduled: self.wake.set()
+
+        while True:
+            await self.wake.wait()
+            self.wake.clear()
+
+            with self.lock:
+                self.is_flush_scheduled = False
+                batch = list(self.outbox)
+                self.outbox.clear()
+                if self.pending_rc is not None: batch.append(self.pending_rc)
+                self.pending_rc = None
+
+            if not self.connection:
+                self.stats['dropped'] += len(batch)
+                continue
+
+            self.stats['flushes'] += 1
+            for message in batch:
+                try:
+                    await self.connection.send(json.dumps(message))
+                    self.stats['sent'] += 1
+                except Exception as e:
+                    self.stats['dropped'] += 1
+                    if debug: print(f"[DBG] Simulator send failed: {e}")
+
+    # Commands (any thread), queued by `post` / `post_rc`
     def takeoff(self):
-        self.execute_in_loop(self._takeoff())
+        print("Simulator taking off.")
+        self.post({"command": "takeoff"})
 
     def land(self):
-        self.execute_in_loop(self._land())
+        print("Simulator landing.")
+        self.post({"command": "land"})
 
     def move_forward(self, duration):
-        self.execute_in_loop(self._move_forward(duration))
+        self.post({"command": "move_forward", "duration": duration})
 
     def move_back(self, duration):
-        self.execute_in_loop(self._move_back(duration))
+        self.post({"command": "move_back", "duration": duration})
 
     def move_right(self, duration):
-        self.execute_in_loop(self._move_right(duration))
+        self.post({"command": "move_right", "duration": duration})
 
     def move_left(self, duration):
-        self.execute_in_loop(self._move_left(duration))
+        self.post({"command": "move_left", "duration": duration})
 
     def move_up(self, duration):
-        self.execute_in_loop(self._move_up(duration))
+        self.post({"command": "move_up", "duration": duration})
 
     def move_down(self, duration):
-        self.execute_in_loop(self._move_down(duration))
+        self.post({"command": "move_down", "duration": duration})
 
     def rotate_clockwise(self, duration):
-        self.execute_in_loop(self._rotate_clockwise(duration))
+        self.post({"command": "rotate_clockwise", "duration": duration})
 
     def rotate_counter_clockwise(self, duration):
-        self.execute_in_loop(self._rotate_counter_clockwise(duration))
+        self.post({"command": "rotate_counter_clockwise", "duration": duration})
 
     def rc_control(self, left_right, forward_backward, up_down, yaw):
-        """Execute RC control with velocities."""
-        self.execute_in_loop(self._rc_control(left_right, forward_backward, up_down, yaw))
+        """Queue RC control with velocities (latest value wins)."""
+        self.post_rc(self.rc_message(left_right, forward_backward, up_down, yaw))
+
+    @staticmethod
+    def rc_message(left_right, forward_backward, up_down, yaw):
+        return {
+            "command": "rc",
+            "params": {
+                "left_right": left_right,
+                "forward_backward": forward_backward,
+                "up_down": up_down,
+                "yaw": yaw
+            }
+        }
 
     # aliases
     def rotate_cw(self, duration):
@@ -96,8 +190,7 @@ class Simulator:
     def rotate_ccw(self, duration):
         self.rotate_counter_clockwise(duration)
 
-
-    # Actual coroutine implementations
+    # Commands received from the simulator (event loop)
     async def _takeoff(self):
         print("Simulator taking off.")
         await self.send_message({"command": "takeoff"})
@@ -138,20 +231,6 @@ class Simulator:
         print(f"Simulator rotating counter-clockwise for {duration} seconds.")
         await self.send_message({"command": "rotate_counter_clockwise", "duration": duration})
 
-    async def _rc_control(self, left_right, forward_backward, up_down, yaw):
-        """Coroutine to handle RC control."""
-        print(f"Simulator RC control: lr={left_right}, fb={forward_backward}, ud={up_down}, yaw={yaw}")
-        await self.send_message({
-            "command": "rc",
-            "params": {
-                "left_right": left_right,
-                "forward_backward": forward_backward,
-                "up_down": up_down,
-                "yaw": yaw
-            }
-        })
-
-
     async def handle_connection(self, websocket, path):
         await self.connect(websocket)
         try:
@@ -184,7 +263,7 @@ class Simulator:
                 await commands[command](duration)
             else:
                 await commands[command]()
-        if command == "rc" and isinstance(duration, dict):
-            await self._rc_control(duration["left_right"], duration["forward_backward"], duration["up_down"], duration["yaw"])
+        elif command == "rc" and isinstance(duration, dict):
+            await self.send_message(self.rc_message(duration["left_right"], duration["forward_backward"], duration["up_down"], duration["yaw"]))
         else:
             print(f"Unknown command: {command}")
@@ -1,13 +1,14 @@
 import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
-from config.settings import FRAME_SIZE, MAX_DISTANCE
+from config.settings import MAX_DISTANCE
 
 # 
 # Helper Class
 # 
 
 class VelocityMapper:
+    # x/y come normalised to half frames (GridNavigator), z in MAX_DISTANCE units
     @staticmethod
-    def map_axis(x_axis: float, y_axis: float, z_axis: float, mx=FRAME_SIZE[0], my=FRAME_SIZE[1], mz=MAX_DISTANCE*2):
+    def map_axis(x_axis: float, y_axis: float, z_axis: float, mx=2, my=2, mz=MAX_DISTANCE*2):
         return \
             x_axis / mx, \
             y_axis / my, \
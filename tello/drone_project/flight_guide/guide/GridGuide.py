@@ -1,11 +1,15 @@
-import cv2
+import cv2, time
 import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
-from navigation_plan.util.draw_grid_3x3 import draw_grid_3x3, highlight_cell
-from config.settings import GRID_CENTER, SAFE_DISTANCE
+from navigation_plan.util.draw_grid_3x3 import grid_geometry
+from user_interface.util.Overlay import Overlay
+from flight_guide.util.PID import PID
+from config.settings import FRAME_SIZE, GRID_CENTER, SAFE_DISTANCE, CONTROL_MODE, PID_GAINS, PID_DERIVATIVE_TAU, PID_DEADBAND, PID_FEED_FORWARD
 
 class GridGuide:
 
-    def __init__(self, navigator, controller, show_grid=True, show_direction=True, show=True, enable=True):
+    AXES = ('x_axis', 'y_axis', 'z_axis')
+
+    def __init__(self, navigator, controller, show_grid=True, show_direction=True, show=True, enable=True, mode=CONTROL_MODE):
 
         # Arguments
         self.navigator = navigator
@@ -14,6 +18,15 @@ class GridGuide:
         self.show_grid = show_grid
         self.show = show
         self.enabled = enable
+        self.mode = mode
+
+        # PID mode
+        self.pids = {axis: PID(**PID_GAINS[axis], derivative_tau=PID_DERIVATIVE_TAU) for axis in self.AXES}
+        self.navigator_updates = 0
+        self.last_update = None
+
+        # Overlay to publish the grid to (the interface's); without it the grid is drawn on the frame
+        self.overlay = None
 
         # State
         self.is_static = True
@@ -26,21 +39,57 @@ class GridGuide:
     # Core
     # 
 
+    def set_overlay(self, overlay): self.overlay = overlay
+
     def calculate_direction(self):
         if not self.navigator.ready:
             return
 
-        # Loop through each axis and zero out if within safe limits
-        for axis, safe_limit in zip(['x_axis', 'y_axis', 'z_axis'], [GRID_CENTER[0] / 2, GRID_CENTER[1] / 2, SAFE_DISTANCE]):
+        if self.mode == "pid": self.calculate_direction_pid()
+        else:                  self.calculate_direction_deadzone()
+
+    def calculate_direction_deadzone(self):
+        # Loop through each axis and zero out if within safe limits (the center cell of the grid, in half frames)
+        for axis, safe_limit in zip(self.AXES, [GRID_CENTER[0] / FRAME_SIZE[0], GRID_CENTER[1] / FRAME_SIZE[1], SAFE_DISTANCE]):
             distance = self.navigator.location[axis]
             self.direction[axis] = 0 if abs(distance) < safe_limit else distance
 
+    def calculate_direction_pid(self):
+        # step once per new navigator location, so dt and the derivative follow the frames
+        updates = getattr(self.navigator, 'updates', self.navigator_updates + 1)
+        if updates == self.navigator_updates: return
+        self.navigator_updates = updates
+
+        # target lost: stop and forget the integral
+        if not getattr(self.navigator, 'tracking', True):
+            for axis in self.AXES:
+                self.pids[axis].reset()
+                self.direction[axis] = 0
+            self.last_update = None
+            return
+
+        now = getattr(self.navigator, 'updated_at', None)
+        if now is None: now = time.time()
+        dt = now - self.last_update if self.last_update is not None else 0
+        self.last_update = now
+
+        limits = {'x_axis': self.navigator.x_limit, 'y_axis': self.navigator.y_limit, 'z_axis': self.navigator.z_limit}
+        velocity = getattr(self.navigator, 'velocity', None) if PID_FEED_FORWARD else None
+
+        # PID on the normalised error, output back in location units
+        for axis in self.AXES:
+            error = self.navigator.location[axis] / limits[axis]
+            feed_forward = velocity[axis] / limits[axis] if velocity else 0.0
+            output = self.pids[axis].update(error, dt, feed_forward) if dt else self.pids[axis].kp * error
+            self.direction[axis] = 0 if abs(output) < PID_DEADBAND else output * limits[axis]
+
 
     def update_grid(self, frame):
 
         if not self.navigator.ready: return
 
-        self.calculate_direction()
+        # the PID is stepped by `loop` only
+        if self.mode != "pid": self.calculate_direction()
 
         cell_idx = lambda v: 2 if v > 0 else (0 if v < 0 else 1)
 
@@ -50,8 +99,29 @@ class GridGuide:
         )
 
         if self.show:
-            if self.show_grid:                              draw_grid_3x3(frame, GRID_CENTER)
-            if self.show_direction and self.cell != (1, 1): highlight_cell(frame, self.cell, GRID_CENTER)
+            # GRID_CENTER is given for FRAME_SIZE; keep the same share of the actual frame
+            height, width = frame.shape[:2]
+            grid_center = (GRID_CENTER[0] * width // FRAME_SIZE[0], GRID_CENTER[1] * height // FRAME_SIZE[1])
+            vertical_lines, horizontal_lines, cells = grid_geometry(width, height, *grid_center)
+
+            primitives = []
+            if self.show_grid:
+                primitives += [Overlay.line((x, 0), (x, height), (255, 255, 255), 1) for x in vertical_lines]
+                primitives += [Overlay.line((0, y), (width, y), (255, 255, 255), 1) for y in horizontal_lines]
+            if self.show_direction and self.cell != (1, 1):
+                primitives.append(Overlay.tint(*cells[self.cell[1] + 3 * self.cell[0]]))
+
+            if self.overlay is not None: self.overlay.set_layer('grid', primitives, order=-1)
+            else:                        Overlay.draw(frame, primitives)
+
+    # 
+    # Latency
+    # 
+
+    def get_stamps(self):
+        """Timestamps of the frame the current direction is based on, plus 'guide'."""
+        stamps = getattr(self.navigator, 'stamps', None)
+        return dict(stamps, guide=time.time()) if stamps else None
 
     # 
     # The "loop"
@@ -61,13 +131,16 @@ class GridGuide:
         if not self.enabled:
             return
 
+        # estimate the target position now, between tracker frames
+        if hasattr(self.navigator, 'refresh'): self.navigator.refresh()
+
         self.calculate_direction()
         
         # Check if any direction is non-zero and move if true
         if any(self.direction.values()):
             self.is_static = False
             # print("D", self.direction)
-            self.controller.move(**self.direction)
+            self.controller.move(**self.direction, stamps=self.get_stamps())
 
         else:
             # print("STATIC")
@@ -0,0 +1,54 @@
+#
+# The "PID" class
+#
+
+class PID:
+    """
+    Single-axis PID with optional feed-forward.
+
+    - Derivative on the measurement error, low-pass filtered with time
+      constant `derivative_tau` (seconds) so tracker noise does not kick.
+    - Anti-windup: the integral is clamped to `limit` and is not accumulated
+      while the output is saturated in the direction of the error.
+    - Feed-forward: `kf * feed_forward` is added to the output (e.g. the
+      target's velocity, so the drone keeps up before an error builds up).
+
+    `update` returns the output clamped to [-limit, limit].
+    """
+
+    def __init__(self, kp, ki=0.0, kd=0.0, kf=0.0, limit=1.0, derivative_tau=0.1):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.kf = kf
+        self.limit = limit
+        self.derivative_tau = derivative_tau
+        self.reset()
+
+    def reset(self):
+        self.integral = 0.0
+        self.derivative = 0.0
+        self.previous_error = None
+        self.output = 0.0
+
+    def update(self, error, dt, feed_forward=0.0):
+        if dt <= 0: return self.output
+
+        # derivative (filtered)
+        if self.previous_error is not None:
+            raw = (error - self.previous_error) / dt
+            alpha = dt / (self.derivative_tau + dt) if self.derivative_tau else 1.0
+            self.derivative += alpha * (raw - self.derivative)
+        self.previous_error = error
+
+        # output before integrating
+        output = self.kp * error + self.integral + self.kd * self.derivative + self.kf * feed_forward
+
+        # integrate unless saturated and pushing further into saturation
+        saturated = abs(output) >= self.limit and (output > 0) == (error > 0)
+        if not saturated:
+            self.integral = max(-self.limit, min(self.limit, self.integral + self.ki * error * dt))
+            output = self.kp * error + self.integral + self.kd * self.derivative + self.kf * feed_forward
+
+        self.output = max(-self.limit, min(self.limit, output))
+        return self.output
@@ -10,14 +10,16 @@ from drone_project.config.settings import debug
 
 load_dotenv()
 
-# Set defaults – note that LightCNNTracker is now prioritized.
+# Set defaults – MODEL is loaded first, FALLBACK_MODEL only if it fails.
 DEFAULT_CAMERA    = "TelloCam"
 DEFAULT_INTERFACE = "QT6Interface"
 DEFAULT_MODEL     = "DaSiamRPNTracker"  
+DEFAULT_FALLBACK  = "CSRTTracker"
 
 camera_type    = sys.argv[1] if len(sys.argv) > 1 else os.getenv("CAMERA",    DEFAULT_CAMERA   )
 interface_type = sys.argv[2] if len(sys.argv) > 2 else os.getenv("INTERFACE", DEFAULT_INTERFACE)
 model_type     = sys.argv[3] if len(sys.argv) > 3 else os.getenv("MODEL",     DEFAULT_MODEL    )
+fallback_type  = os.getenv("FALLBACK_MODEL", DEFAULT_FALLBACK)
 
 #  
 # Globals
@@ -32,6 +34,19 @@ interface = None
 model = None
 navigator = None
 guide = None
+pipeline = None
+worker = None
+recorder = None
+model_loader = None
+
+# Startup timings
+startup_time = time.perf_counter()
+first_tracked_frame = False
+
+def timed(stage, func):
+    start = time.perf_counter()
+    func()
+    print(f"[INFO] {stage}: {time.perf_counter() - start:.2f}s")
 
 #  
 # Instances Setup
@@ -83,6 +98,11 @@ def setup_camera():
         camera = WebCam()
         return
 
+    if camera_type == "ReplayCam":
+        from drone_project.object_detector.input.ReplayCam import ReplayCam
+        camera = ReplayCam(os.getenv("REPLAY_PATH"), float(os.getenv("REPLAY_SPEED", 1)), bool(int(os.getenv("REPLAY_LOOP", False))))
+        return
+
     raise ImportError(f"Camera {camera_type} is not implemented.")
 
 # Controller
@@ -99,7 +119,7 @@ def setup_controller():
         controller = SimController()
         return
 
-    if camera_type == "WebCam":
+    if camera_type in ("WebCam", "ReplayCam"):
         from core.controllers.DummyController import DummyController
         controller = DummyController()
         return
@@ -123,33 +143,21 @@ def setup_interface():
     
     raise ImportError(f"Interface {interface_type} is not implemented.")
 
-# Model – Prioritize LightCNNTracker, fallback to the model specified if an error occurs.
+# Model – Warm the selected model in the background, fall back to FALLBACK_MODEL if it fails.
+def start_model_loader():
+    global model_loader
+    from drone_project.object_detector.models.ModelLoader import ModelLoader
+    model_loader = ModelLoader(model_type, fallback_type)
+
 def setup_model():
     global model
-    try:
-        from drone_project.object_detector.models.LightCNNTracker import LightCNNTracker
-        model = LightCNNTracker(interface)
-        print("LightCNNTracker loaded successfully.")
-    except Exception as e:
-        print("Error loading LightCNNTracker:", e)
-        # Fallback based on the specified model_type:
-        if model_type == "DaSiamMultipleTracker":
-            from drone_project.object_detector.models.DaSiamMultipleTracker import DaSiamMultipleTracker
-            model = DaSiamMultipleTracker(interface)
-        elif model_type == "DaSiamRPNTracker":
-            from drone_project.object_detector.models.DaSiamRPNTracker import DaSiamRPNTracker
-            model = DaSiamRPNTracker(interface)
-        elif model_type == "CSRTTracker":
-            from drone_project.object_detector.models.CSRTTracker import CSRTTracker
-            model = CSRTTracker(interface)
-        elif model_type == "YoloV8Tracker":
-            from drone_project.object_detector.models.YoloV8Tracker import YoloV8Tracker
-            model = YoloV8Tracker(interface)
-        else:
-            # Default fallback
-            from drone_project.object_detector.models.DaSiamMultipleTracker import DaSiamMultipleTracker
-            model = DaSiamMultipleTracker(interface)
-        print("Fallback model loaded successfully.")
+    model = model_loader.get(interface)
+
+    for stage, elapsed in model_loader.timings.items():
+        print(f"[INFO] {stage}: {elapsed:.2f}s")
+    if model_loader.loaded_name != model_type:
+        print(f"Error loading {model_type}:", model_loader.error)
+    print(f"{model_loader.loaded_name} loaded successfully.")
 
 # Navigator
 def setup_navigator():
@@ -172,29 +180,86 @@ def setup_guide():
 
 # Setup
 def setup():
-    interface.set_camera(camera)
+    global pipeline
+    from drone_project.config.settings import THREADED_PIPELINE
 
+    interface.set_camera(camera)
+    guide.set_overlay(interface.overlay)
     interface.add_on_boundary(model.set_object)
+    setup_recorder()
+
+    if THREADED_PIPELINE:
+        from core.util.classes.FramePipeline import FramePipeline
+        pipeline = FramePipeline(camera)
+        pipeline.add_inference_listener(model.on_frame)
+        pipeline.add_control_listener(navigator.navigate, with_stamps=True)
+        pipeline.add_control_listener(report_first_tracked_frame)
+        pipeline.add_render_listener(guide.update_grid)
+        if recorder: pipeline.add_control_listener(recorder.on_frame, with_stamps=True)
+        interface.set_pipeline(pipeline)
+        controller.latency = pipeline.latency
+        navigator.latency = pipeline.latency
+        if pipeline.ring and hasattr(model, 'set_ring'): model.set_ring(pipeline.ring)
+        pipeline.start()
+        return
+
     interface.add_frame_listener(model.on_frame)
     interface.add_frame_listener(navigator.navigate)
     interface.add_frame_listener(guide.update_grid)
+    interface.add_frame_listener(report_first_tracked_frame)
+    if recorder: interface.add_frame_listener(recorder.on_frame)
+
+# Flight Recorder
+def setup_recorder():
+    global recorder
+    from drone_project.config.settings import RECORD_FLIGHTS, RECORD_DIR
+    if not (RECORD_FLIGHTS or os.getenv("RECORD", "0") == "1"): return
+
+    from core.util.classes.FlightRecorder import FlightRecorder
+    path = os.path.join(RECORD_DIR, time.strftime("flight-%Y%m%d-%H%M%S"))
+    recorder = FlightRecorder(path)
+    recorder.attach(model, navigator, guide, controller)
+    print("[INFO] Recording flight to", path)
+
+def shutdown():
+    if worker: worker.stop()
+    if recorder: recorder.stop()
+    if hasattr(model, 'close'): model.close()
+    if hasattr(controller, 'close'): controller.close()
+    tello_shutdown()
+
+# Startup metric: time to the first frame with a tracked target
+def report_first_tracked_frame(frame):
+    global first_tracked_frame
+    if first_tracked_frame or not model.center: return
+
+    first_tracked_frame = True
+    print(f"[INFO] first tracked frame: {time.perf_counter() - startup_time:.2f}s after launch")
 
 # Loop
 def loop():
+    global worker
     if interface_type == "QT6Interface":
         from PyQt6.QtCore import QTimer
         from config.settings import MAIN_LOOP_RATE
 
-        def _loop():
-            guide.loop()
-            controller.loop()
-        
-        guide_timer = QTimer()
-        guide_timer.timeout.connect(_loop)
-        guide_timer.start(MAIN_LOOP_RATE)
+        # With the pipeline, guide / controller run in their own QThread and the GUI thread only displays
+        if pipeline:
+            from user_interface.util.QtWorkers import LoopWorker
+            worker = LoopWorker(guide, controller, MAIN_LOOP_RATE)
+            worker.failed.connect(interface.on_loop_failed)
+            worker.start()
+        else:
+            def _loop():
+                guide.loop()
+                controller.loop()
+            
+            guide_timer = QTimer()
+            guide_timer.timeout.connect(_loop)
+            guide_timer.start(MAIN_LOOP_RATE)
 
         app.exec()
-        tello_shutdown()
+        shutdown()
 
         return
     
@@ -213,7 +278,7 @@ def loop():
             if debug: 
                 raise e
         finally:
-            tello_shutdown()
+            shutdown()
         return
 
 #  
@@ -221,12 +286,14 @@ def loop():
 # 
 
 if __name__ == "__main__":
-    setup_tello()
-    setup_camera()
-    setup_controller()
-    setup_interface()
-    setup_model()
+    start_model_loader()
+    timed("setup_tello", setup_tello)
+    timed("setup_camera", setup_camera)
+    timed("setup_controller", setup_controller)
+    timed("setup_interface", setup_interface)
+    timed("setup_model (wait)", setup_model)
     setup_navigator()
     setup_guide() 
     setup()
+    print(f"[INFO] startup: {time.perf_counter() - startup_time:.2f}s")
     loop()
@@ -0,0 +1,56 @@
+import sys, os, time
+import argparse
+import csv
+import gzip
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from core.HeadlessRunner import HeadlessRunner
+from object_detector.input.FileCam import FileCam
+
+# ——————————————————————————
+# Arguments
+# ——————————————————————————
+parser = argparse.ArgumentParser(description='Run a tracker, GridNavigator and GridGuide on a recorded video without UI or drone.')
+parser.add_argument('source', type=str, help='Video file or directory of images')
+parser.add_argument('--model', default=os.getenv("MODEL", "CSRTTracker"), type=str, help='Tracker name (see object_detector/models)')
+parser.add_argument('--boundary', default=None, type=str, help='Initial target box as x,y,w,h')
+parser.add_argument('--init-frame', default=0, type=int, help='Frame on which the boundary is selected')
+parser.add_argument('--max-frames', default=None, type=int, help='Stop after this many frames')
+parser.add_argument('--output', default='headless_run.csv.gz', type=str, help='Per-frame output (.csv or .csv.gz)')
+
+
+def open_output(path):
+    return gzip.open(path, 'wt', newline='') if path.endswith('.gz') else open(path, 'w', newline='')
+
+
+def fmt(value):
+    return f"{value:.2f}" if isinstance(value, float) else ('' if value is None else value)
+
+
+# ——————————————————————————
+# Entry Point
+# ——————————————————————————
+def main():
+    args = parser.parse_args()
+    boundary = tuple(int(v) for v in args.boundary.split(',')) if args.boundary else None
+
+    camera = FileCam(args.source)
+    runner = HeadlessRunner(camera, args.model, boundary, args.init_frame)
+
+    start = time.perf_counter()
+    frames, model_ms = 0, 0.0
+    with open_output(args.output) as f:
+        writer = csv.writer(f)
+        writer.writerow(HeadlessRunner.FIELDS)
+        for record in runner.run(args.max_frames):
+            writer.writerow([fmt(record[k]) for k in HeadlessRunner.FIELDS])
+            frames += 1
+            model_ms += record['model_ms']
+
+    elapsed = time.perf_counter() - start
+    print(f"{frames} frames in {elapsed:.2f}s ({frames / max(elapsed, 1e-9):.1f} fps, "
+          f"model {model_ms / max(frames, 1):.1f} ms/frame, source {camera.frame_rate:.0f} fps) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
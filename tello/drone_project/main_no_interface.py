@@ -14,11 +14,13 @@ logger = logging.getLogger(__name__)
 # default interface & model; camera auto-detected
 DEFAULT_INTERFACE = "QT6Interface"
 DEFAULT_MODEL     = "LightCNNTracker"
+DEFAULT_FALLBACK  = "CSRTTracker"
 
 # these get set at runtime
 camera_type    = None
 interface_type = os.getenv("INTERFACE", DEFAULT_INTERFACE)
 model_type     = os.getenv("MODEL",     DEFAULT_MODEL)
+fallback_type  = os.getenv("FALLBACK_MODEL", DEFAULT_FALLBACK)
 
 # globals
 tello = None
@@ -29,12 +31,32 @@ interface = None
 model = None
 navigator = None
 guide = None
+pipeline = None
+worker = None
+recorder = None
+model_loader = None
+
+# startup timings
+startup_time = time.perf_counter()
+first_tracked_frame = False
+
+
+def timed(stage, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    logger.info(f"{stage}: {time.perf_counter() - start:.2f}s")
+    return result
 
 
 # ——————————————————————————
 # Auto-detect best camera
 # ——————————————————————————
 def detect_camera():
+    # 0) Replay a recorded flight
+    if os.getenv("REPLAY_PATH"):
+        logger.info(f"Replaying {os.getenv('REPLAY_PATH')}.")
+        return "ReplayCam"
+
     # 1) Try Tello
     try:
         from djitellopy import Tello
@@ -103,6 +125,9 @@ def setup_camera():
     elif camera_type == "SimCam":
         from drone_project.object_detector.input.SimCam import SimCam
         camera = SimCam()
+    elif camera_type == "ReplayCam":
+        from drone_project.object_detector.input.ReplayCam import ReplayCam
+        camera = ReplayCam(os.getenv("REPLAY_PATH"), float(os.getenv("REPLAY_SPEED", 1)), bool(int(os.getenv("REPLAY_LOOP", False))))
     else:
         raise ImportError(f"Unknown camera type: {camera_type}")
     logger.info(f"Camera set to {type(camera)}")
@@ -114,7 +139,7 @@ def setup_controller():
     if camera_type == "TelloCam":
         from drone_project.core.controllers.TelloControllerSmooth import TelloControllerSmooth
         controller = TelloControllerSmooth(tello, False)
-    elif camera_type == "WebCam":
+    elif camera_type in ("WebCam", "ReplayCam"):
         from drone_project.core.controllers.DummyController import DummyController
         controller = DummyController()
     else:  # SimCam
@@ -139,30 +164,20 @@ def setup_interface():
     logger.info(f"Interface set to {type(interface)}")
 
 
+def start_model_loader():
+    global model_loader
+    from drone_project.object_detector.models.ModelLoader import ModelLoader
+    logger.info(f"Loading model in background: {model_type}")
+    model_loader = ModelLoader(model_type, fallback_type)
+
+
 def setup_model():
     global model
-    logger.info(f"Loading model: {model_type}")
-    try:
-        from drone_project.object_detector.models.LightCNNTracker import LightCNNTracker
-        model = LightCNNTracker(interface)
-    except Exception:
-        # fallback by model_type
-        if model_type == "DaSiamMultipleTracker":
-            from drone_project.object_detector.models.DaSiamMultipleTracker import DaSiamMultipleTracker
-            model = DaSiamMultipleTracker(interface)
-        elif model_type == "DaSiamRPNTracker":
-            from drone_project.object_detector.models.DaSiamRPNTracker import DaSiamRPNTracker
-            model = DaSiamRPNTracker(interface)
-        elif model_type == "CSRTTracker":
-            from drone_project.object_detector.models.CSRTTracker import CSRTTracker
-            model = CSRTTracker(interface)
-        elif model_type == "YoloV8Tracker":
-            from drone_project.object_detector.models.YoloV8Tracker import YoloV8Tracker
-            model = YoloV8Tracker(interface)
-        else:
-            # default fallback
-            from drone_project.object_detector.models.LightCNNTracker import LightCNNTracker
-            model = LightCNNTracker(interface)
+    model = model_loader.get(interface)
+    for stage, elapsed in model_loader.timings.items():
+        logger.info(f"{stage}: {elapsed:.2f}s")
+    if model_loader.loaded_name != model_type:
+        logger.warning(f"{model_type} failed ({model_loader.error}), using {model_loader.loaded_name}")
     logger.info(f"Model initialized: {type(model)}")
 
 
@@ -183,54 +198,126 @@ def setup_guide():
 def bind_listeners():
     if interface is None or camera is None:
         raise RuntimeError("Interface and camera must be initialized first")
+    global pipeline
+    from drone_project.config.settings import THREADED_PIPELINE
+
     interface.set_camera(camera)
+    guide.set_overlay(interface.overlay)
     interface.add_on_boundary(model.set_object)
+    setup_recorder()
+
+    if THREADED_PIPELINE:
+        from drone_project.core.util.classes.FramePipeline import FramePipeline
+        pipeline = FramePipeline(camera)
+        pipeline.add_inference_listener(model.on_frame)
+        pipeline.add_control_listener(navigator.navigate, with_stamps=True)
+        pipeline.add_control_listener(report_first_tracked_frame)
+        pipeline.add_render_listener(guide.update_grid)
+        if recorder:
+            pipeline.add_control_listener(recorder.on_frame, with_stamps=True)
+        interface.set_pipeline(pipeline)
+        controller.latency = pipeline.latency
+        navigator.latency = pipeline.latency
+        if pipeline.ring and hasattr(model, "set_ring"):
+            model.set_ring(pipeline.ring)
+        pipeline.start()
+        logger.info("Pipeline started.")
+        return
+
     interface.add_frame_listener(model.on_frame)
     interface.add_frame_listener(navigator.navigate)
     interface.add_frame_listener(guide.update_grid)
+    interface.add_frame_listener(report_first_tracked_frame)
+    if recorder:
+        interface.add_frame_listener(recorder.on_frame)
     logger.info("Listeners bound.")
 
 
+def setup_recorder():
+    global recorder
+    from drone_project.config.settings import RECORD_FLIGHTS, RECORD_DIR
+    if not (RECORD_FLIGHTS or os.getenv("RECORD", "0") == "1"):
+        return
+
+    from drone_project.core.util.classes.FlightRecorder import FlightRecorder
+    path = os.path.join(RECORD_DIR, time.strftime("flight-%Y%m%d-%H%M%S"))
+    recorder = FlightRecorder(path)
+    recorder.attach(model, navigator, guide, controller)
+    logger.info(f"Recording flight to {path}")
+
+
+def shutdown():
+    if worker:
+        worker.stop()
+    if recorder:
+        recorder.stop()
+    if hasattr(model, "close"):
+        model.close()
+    if hasattr(controller, "close"):
+        controller.close()
+    tello_shutdown()
+
+
+def report_first_tracked_frame(frame):
+    global first_tracked_frame
+    if first_tracked_frame or not model.center:
+        return
+    first_tracked_frame = True
+    logger.info(f"First tracked frame {time.perf_counter() - startup_time:.2f}s after launch")
+
+
 # ——————————————————————————
 # Main Initialization & Loop
 # ——————————————————————————
 def initialize_system():
     global camera_type
+    # warm the model while the hardware comes up
+    start_model_loader()
+
     # auto-detect
-    camera_type = detect_camera()
+    camera_type = timed("detect_camera", detect_camera)
     os.environ["CAMERA"] = camera_type
 
     # if drone, start it
     if camera_type == "TelloCam":
-        setup_tello()
+        timed("setup_tello", setup_tello)
 
     # core setup
-    setup_camera()
-    setup_controller()
-    setup_interface()
-    setup_model()
+    timed("setup_camera", setup_camera)
+    timed("setup_controller", setup_controller)
+    timed("setup_interface", setup_interface)
+    timed("setup_model (wait)", setup_model)
     setup_navigator()
     setup_guide()
     bind_listeners()
+    logger.info(f"Startup: {time.perf_counter() - startup_time:.2f}s")
 
     return camera, model
 
 
 def loop():
+    global worker
     # QT6Interface run
     if interface_type == "QT6Interface":
         from PyQt6.QtCore import QTimer
         from drone_project.config.settings import MAIN_LOOP_RATE
 
-        def _tick():
-            guide.loop()
-            controller.loop()
+        # with the pipeline, guide / controller run in their own QThread
+        if pipeline:
+            from drone_project.user_interface.util.QtWorkers import LoopWorker
+            worker = LoopWorker(guide, controller, MAIN_LOOP_RATE)
+            worker.failed.connect(interface.on_loop_failed)
+            worker.start()
+        else:
+            def _tick():
+                guide.loop()
+                controller.loop()
 
-        timer = QTimer()
-        timer.timeout.connect(_tick)
-        timer.start(MAIN_LOOP_RATE)
+            timer = QTimer()
+            timer.timeout.connect(_tick)
+            timer.start(MAIN_LOOP_RATE)
         app.exec()
-        tello_shutdown()
+        shutdown()
         return
 
     # CV2Interface run
@@ -243,7 +330,7 @@ def loop():
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     finally:
-        tello_shutdown()
+        shutdown()
 
 
 # ——————————————————————————
@@ -0,0 +1,142 @@
+# 
+# Imports
+# 
+
+import threading
+import numpy as np
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from config.settings import KALMAN_PROCESS_NOISE, KALMAN_SIZE_NOISE, KALMAN_MEASUREMENT_NOISE, KALMAN_MAX_COAST
+
+# 
+# The "KalmanEstimator" class
+# 
+
+class KalmanEstimator:
+    """
+    Constant-velocity Kalman filter on the target box.
+
+    State: (cx, cy, w, h, vcx, vcy, vw, vh) in frame pixels and pixels/second.
+    `update` fuses a tracker output taken at time `t` (boundary optional, then
+    only the center is measured), `miss` advances the filter over a frame
+    without detection, and `predict(t)` returns the estimate at any time
+    without changing the filter, so the position can be queried between
+    (or instead of) detections. After `max_coast` seconds without a
+    detection the target counts as lost and the filter resets.
+
+    Thread safe: the tracker side and the control side may run in different threads.
+    """
+
+    INITIAL_VELOCITY_STD = 500 # px/s
+
+    def __init__(self, process_noise=KALMAN_PROCESS_NOISE, size_noise=KALMAN_SIZE_NOISE, measurement_noise=KALMAN_MEASUREMENT_NOISE, max_coast=KALMAN_MAX_COAST):
+
+        # Arguments
+        self.process_noise = process_noise
+        self.size_noise = size_noise
+        self.measurement_noise = measurement_noise
+        self.max_coast = max_coast
+
+        # State
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.x = None
+        self.P = None
+        self.time = None
+        self.measured_at = None
+        self.has_size = False # a boundary (not only a center) was measured
+
+    @property
+    def initialized(self): return self.x is not None
+
+    # 
+    # Model
+    # 
+
+    def transition(self, dt):
+        F = np.eye(8)
+        F[:4, 4:] = np.eye(4) * dt
+
+        # white acceleration noise per dimension
+        Q = np.zeros((8, 8))
+        for i, q in enumerate((self.process_noise, self.process_noise, self.size_noise, self.size_noise)):
+            q2 = q * q
+            Q[i, i] = q2 * dt**4 / 4
+            Q[i, i + 4] = Q[i + 4, i] = q2 * dt**3 / 2
+            Q[i + 4, i + 4] = q2 * dt**2
+        return F, Q
+
+    def advance(self, t):
+        dt = t - self.time
+        if dt <= 0: return
+        F, Q = self.transition(dt)
+        self.x = F @ self.x
+        self.P = F @ self.P @ F.T + Q
+        self.time = t
+
+    @staticmethod
+    def measurement(center, boundary):
+        if boundary is not None:
+            x, y, w, h = boundary
+            return np.array([center[0], center[1], w, h], dtype=float), np.eye(4, 8)
+        return np.array(center, dtype=float), np.eye(2, 8)
+
+    # 
+    # Filter
+    # 
+
+    def update(self, center, boundary, t):
+        z, H = self.measurement(center, boundary)
+        R = np.eye(len(z)) * self.measurement_noise**2
+
+        with self.lock:
+            self.has_size = self.has_size or boundary is not None
+            if self.x is None:
+                # initialize from the first detection; unknown size stays at 0 with a wide variance
+                self.x = np.zeros(8)
+                self.x[:len(z)] = z
+                self.P = np.diag([self.measurement_noise**2] * 4 + [self.INITIAL_VELOCITY_STD**2] * 4)
+                if len(z) < 4: self.P[2, 2] = self.P[3, 3] = 1e6
+                self.time = self.measured_at = t
+                return
+
+            self.advance(t)
+            S = H @ self.P @ H.T + R
+            K = self.P @ H.T @ np.linalg.inv(S)
+            self.x = self.x + K @ (z - H @ self.x)
+            self.P = (np.eye(8) - K @ H) @ self.P
+            self.measured_at = max(self.measured_at, t)
+
+    def miss(self, t):
+        with self.lock:
+            if self.x is None: return
+            if t - self.measured_at > self.max_coast:
+                self.reset()
+                return
+            self.advance(t)
+
+    def predict(self, t, lead=0.0):
+        """Return (state, covariance) extrapolated to `t + lead`, or None if not tracking at `t`."""
+        with self.lock:
+            if self.x is None or t - self.measured_at > self.max_coast: return None
+            F, Q = self.transition(max(0.0, t + lead - self.time))
+            return F @ self.x, F @ self.P @ F.T + Q
+
+    # 
+    # Estimate
+    # 
+
+    @property
+    def center(self): return None if self.x is None else (self.x[0], self.x[1])
+
+    @property
+    def velocity(self): return None if self.x is None else (self.x[4], self.x[5])
+
+    @property
+    def covariance(self): return None if self.P is None else self.P.copy()
+
+    @property
+    def position_std(self):
+        """Standard deviation of the center estimate in pixels (higher means less confident)."""
+        return None if self.P is None else float(np.sqrt(self.P[0, 0] + self.P[1, 1]))
@@ -0,0 +1 @@
+# from .KalmanEstimator import KalmanEstimator
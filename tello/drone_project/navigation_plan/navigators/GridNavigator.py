@@ -2,9 +2,10 @@
 # Imports
 # 
 
-import cv2
+import cv2, time
+import threading
 import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..//")))
-from config.settings import FRAME_SIZE, MAX_DISTANCE, GRID_CENTER, debug
+from config.settings import FRAME_SIZE, MAX_DISTANCE, GRID_CENTER, ESTIMATOR, LATENCY_COMPENSATION, ACTUATION_DELAY, MAX_COMPENSATION, debug
 
 # 
 # Custom Exceptions
@@ -24,64 +25,211 @@ class GridNavigator:
     # Constructor
     # 
 
-    def __init__(self, model, enabled=True):
+    def __init__(self, model, enabled=True, estimator=ESTIMATOR, clock=time.time):
         
         # Arguments
         self.model = model
         self.enabled = enabled
-
-        # Config
-        self.x_limit = FRAME_SIZE[0] // 2
-        self.y_limit = FRAME_SIZE[1] // 2
+        self.clock = clock # time source for the estimator, e.g. the source time of recorded video
+        self.compensate = LATENCY_COMPENSATION
+        self.latency = None # LatencyMonitor, set by the app
+        self.lock = threading.RLock() # `estimate` (control stage) vs `refresh` (guide loop)
+
+        # Estimator: smooths the tracker output and predicts between detections (see `refresh`)
+        self.estimator = None
+        if estimator == "kalman":
+            from navigation_plan.estimators.KalmanEstimator import KalmanEstimator
+            self.estimator = KalmanEstimator()
+
+        # Config – x/y are normalised to the frame (-1..1 from edge to edge), z to MAX_DISTANCE,
+        # so the location does not depend on the resolution the tracker runs at
+        self.x_limit = 1.0
+        self.y_limit = 1.0
         self.z_limit = MAX_DISTANCE
         self.DISTANCE_THRESHOLD = 5
         self.grid_center_area = GRID_CENTER[0] * GRID_CENTER[1]
+        self.target_area_ratio = self.grid_center_area / self.DISTANCE_THRESHOLD / (FRAME_SIZE[0] * FRAME_SIZE[1])
         
         # Variables
         self.location = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+        self.velocity = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0} # location units per second
+        self.measured_location = self.location # before latency compensation (raw tracker mode)
         self.ready = False
+        self.tracking = False # target seen on the last frame
+        self.updates = 0      # number of `navigate` calls, for consumers polling new locations
+        self.updated_at = None
+        self.frame_size = FRAME_SIZE
+        self.stamps = None # stage timestamps of the frame behind `location`
+        self.compensation = {'horizon': 0, 'shift': {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}} # last projection applied
 
     # 
     # Calculate Location
     # 
-    
-    def calculate_location(self, frame):
-        
-        if self.model.center is None:
+
+    def get_target(self):
+        """The tracker's (center, boundary), or (None, None) without a valid target."""
+        center = self.model.center
+        if center is None:
             # raise PointModelExpectedError("GridNavigator requires a Model with 'center' attribute.")
+            return None, None
+        elif not isinstance(center, tuple) or len(center) != 2:
+            return None, None
+        return center, self.model.boundary
+
+    def set_location(self, center, size=None):
+        self.location = self.location_of(center, size)
+        self.tracking = True
+        self.ready = True
+
+    def location_of(self, center, size=None):
+        # diff, in half frames
+        frame_width, frame_height = self.frame_size
+        diff_x = (center[0] - frame_width / 2) / (frame_width / 2)
+        diff_y = (center[1] - frame_height / 2) / (frame_height / 2)
+
+        # x and y
+        location = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+        location['x_axis'] = max(-self.x_limit, min(self.x_limit, diff_x))
+        location['y_axis'] = -max(-self.y_limit, min(self.y_limit, diff_y))
+
+        # z
+        if size is not None:
+            area = size[0] * size[1]
+            z_value = (area - self.target_area()) / self.z_scale()
+            location['z_axis'] = -max(-self.z_limit, min(self.z_limit, z_value))
+
+        return location
+
+    # target box area in pixels of the current frame, and pixels per z unit
+    def target_area(self): return self.target_area_ratio * self.frame_size[0] * self.frame_size[1]
+    def z_scale(self): return self.target_area() / MAX_DISTANCE
+
+    def calculate_location(self, frame):
+        frame_height, frame_width = frame.shape[:2]
+        self.frame_size = (frame_width, frame_height)
+
+        center, boundary = self.get_target()
+        if center is None:
             self.location = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+            self.tracking = False
             return
-        elif not isinstance(self.model.center, tuple) or len(self.model.center) != 2:
-            # print("_")
-            self.location = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+
+        self.set_location(center, boundary[2:] if boundary is not None else None)
+
+    def update_velocity(self, previous, was_tracking, now):
+        # finite difference between consecutive tracked frames
+        if not (self.tracking and was_tracking) or self.updated_at is None or now <= self.updated_at:
+            self.velocity = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
             return
 
-        # diff
-        frame_height, frame_width = frame.shape[:2]
-        frame_center = (frame_width // 2, frame_height // 2)
-        diff_x = self.model.center[0] - frame_center[0]
-        diff_y = self.model.center[1] - frame_center[1]
+        dt = now - self.updated_at
+        self.velocity = {axis: (self.location[axis] - previous[axis]) / dt for axis in self.location}
 
-        # x and y
-        self.location['x_axis'] = max(-self.x_limit, min(self.x_limit, diff_x))
-        self.location['y_axis'] = -max(-self.y_limit, min(self.y_limit, diff_y))
+    # 
+    # Latency Compensation
+    # 
 
-        # z
-        if self.model.boundary is not None:
-            area = self.model.boundary[2] * self.model.boundary[3]
-            target_area = self.grid_center_area / self.DISTANCE_THRESHOLD
-            z_value = (area - target_area) / (target_area / MAX_DISTANCE)
-            self.location['z_axis'] = -max(-self.z_limit, min(self.z_limit, z_value))
+    def get_lead(self, stage):
+        """Seconds from `stage` to the drone reacting: measured p50 latency (if known) plus ACTUATION_DELAY."""
+        if not self.compensate: return 0
+        measured = self.latency.get(stage) if self.latency else None
+        return min(MAX_COMPENSATION, (measured or 0) + ACTUATION_DELAY)
+
+    def report_compensation(self, horizon, before):
+        # `before`: the location without compensation
+        self.compensation = {
+            'horizon': horizon,
+            'shift': {axis: self.location[axis] - before[axis] for axis in self.location},
+        }
+        if self.latency: self.latency.record("compensation", horizon)
+
+    def project(self, horizon):
+        """Shift `location` along `velocity` by `horizon` seconds (raw tracker mode)."""
+        before = self.measured_location
+        limits = {'x_axis': self.x_limit, 'y_axis': self.y_limit, 'z_axis': self.z_limit}
+        self.location = {
+            axis: max(-limits[axis], min(limits[axis], before[axis] + self.velocity[axis] * horizon))
+            for axis in before
+        }
+        self.report_compensation(horizon, before)
 
-        self.ready = True
+    # 
+    # Estimator
+    # 
+
+    def estimate(self, frame, now):
+        with self.lock:
+            frame_height, frame_width = frame.shape[:2]
+            self.frame_size = (frame_width, frame_height)
+
+            center, boundary = self.get_target()
+            if center is None: self.estimator.miss(now)
+            else:              self.estimator.update(center, boundary, now)
+
+            # skipped if the guide loop already refreshed past `now`; its next refresh includes this measurement
+            self.refresh(now)
+
+    def refresh(self, now=None, lead=None):
+        """
+        Recompute `location` and `velocity` from the estimator at `now`
+        (default: the current time), e.g. from the guide loop between frames.
+        With latency compensation the target is projected `lead` seconds
+        further (default: measured guide->rc latency plus ACTUATION_DELAY),
+        to where it will be when the command takes effect.
+        `updated_at` only moves forward: a refresh for an earlier time
+        than the last one is ignored. Returns False if nothing was refreshed.
+        """
+        if not self.estimator: return False
+        with self.lock:
+            now = self.clock() if now is None else now
+            if self.updated_at is not None and now < self.updated_at: return False
+            self.predict_location(now, self.get_lead("guide->rc") if lead is None else lead)
+            self.updated_at = now
+            self.updates += 1
+            return True
+
+    def predict_location(self, now, lead):
+        prediction = self.estimator.predict(now, lead)
+        if prediction is None:
+            self.location = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+            self.velocity = {'x_axis': 0, 'y_axis': 0, 'z_axis': 0}
+            self.tracking = False
+        else:
+            (cx, cy, w, h, vcx, vcy, vw, vh), _ = prediction
+            has_size = self.estimator.has_size
+            self.set_location((cx, cy), (w, h) if has_size else None)
+            if lead:
+                # unprojected location, to report the shift
+                (cx0, cy0, w0, h0, *_), _ = self.estimator.predict(now) or prediction
+                self.report_compensation(now + lead - self.estimator.measured_at, self.location_of((cx0, cy0), (w0, h0) if has_size else None))
+            self.velocity = {
+                'x_axis': vcx / (self.frame_size[0] / 2),
+                'y_axis': -vcy / (self.frame_size[1] / 2),
+                'z_axis': -(w * vh + h * vw) / self.z_scale() if has_size else 0,
+            }
 
     # 
     # Core
     # 
 
-    def navigate(self, frame):
+    def navigate(self, frame, stamps=None):
 
         if not self.enabled: return
-        self.calculate_location(frame)
+        now = stamps['capture'] if stamps else self.clock()
+
+        if self.estimator:
+            self.estimate(frame, now)
+        else:
+            previous, was_tracking = self.measured_location, self.tracking
+            self.calculate_location(frame)
+            self.measured_location = self.location
+            self.update_velocity(previous, was_tracking, now)
+            self.updated_at = now
+            self.updates += 1
+
+            # the location is used until the next frame: project over the whole capture to rc path
+            if self.tracking and self.compensate: self.project(self.get_lead("photon->rc"))
+
+        self.stamps = dict(stamps, control=time.time()) if stamps else None
         
         # print("LOC: ", self.location)
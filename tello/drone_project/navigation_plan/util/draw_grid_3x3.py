@@ -1,15 +1,33 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 
-def draw_grid_3x3(frame, center_cell_size=(100, 100)):
-    frame_height, frame_width = frame.shape[:2]
-    center_w, center_h = center_cell_size
-    
+@lru_cache(maxsize=16)
+def grid_geometry(frame_width, frame_height, center_w, center_h):
+    """Grid lines and the nine cell rectangles, computed once per (frame size, center cell size)."""
     side_w = (frame_width - center_w) // 2
     side_h = (frame_height - center_h) // 2
 
-    vertical_lines = [side_w, side_w + center_w]
-    horizontal_lines = [side_h, side_h + center_h]
+    vertical_lines = (side_w, side_w + center_w)
+    horizontal_lines = (side_h, side_h + center_h)
+
+    cells = (
+        ((0, 0), (side_w, side_h)),                                            # Top-left
+        ((side_w, 0), (side_w + center_w, side_h)),                            # Top-center
+        ((side_w + center_w, 0), (frame_width, side_h)),                       # Top-right
+        ((0, side_h), (side_w, side_h + center_h)),                            # Middle-left
+        ((side_w, side_h), (side_w + center_w, side_h + center_h)),            # Center
+        ((side_w + center_w, side_h), (frame_width, side_h + center_h)),       # Middle-right
+        ((0, side_h + center_h), (side_w, frame_height)),                      # Bottom-left
+        ((side_w, side_h + center_h), (side_w + center_w, frame_height)),      # Bottom-center
+        ((side_w + center_w, side_h + center_h), (frame_width, frame_height)), # Bottom-right
+    )
+
+    return vertical_lines, horizontal_lines, cells
+
+def draw_grid_3x3(frame, center_cell_size=(100, 100)):
+    frame_height, frame_width = frame.shape[:2]
+    vertical_lines, horizontal_lines, _ = grid_geometry(frame_width, frame_height, *center_cell_size)
     
     for x in vertical_lines:
         cv2.line(frame, (x, 0), (x, frame_height), (255, 255, 255), 1)
@@ -24,31 +42,13 @@ def highlight_cell(frame, cell=(1, 1), center_cell_size=(100,100), alpha=0.5):
     if not cell or not len(cell): return
     
     frame_height, frame_width = frame.shape[:2]
-    center_w, center_h = center_cell_size
-    
-    side_w = (frame_width - center_w) // 2
-    side_h = (frame_height - center_h) // 2
-
-    cells = [
-        [(0, 0), (side_w, side_h)],                                            # Top-left
-        [(side_w, 0), (side_w + center_w, side_h)],                            # Top-center
-        [(side_w + center_w, 0), (frame_width, side_h)],                       # Top-right
-        [(0, side_h), (side_w, side_h + center_h)],                            # Middle-left
-        [(side_w, side_h), (side_w + center_w, side_h + center_h)],            # Center
-        [(side_w + center_w, side_h), (frame_width, side_h + center_h)],       # Middle-right
-        [(0, side_h + center_h), (side_w, frame_height)],                      # Bottom-left
-        [(side_w, side_h + center_h), (side_w + center_w, frame_height)],      # Bottom-center
-        [(side_w + center_w, side_h + center_h), (frame_width, frame_height)]  # Bottom-right
-    ]
+    _, _, cells = grid_geometry(frame_width, frame_height, *center_cell_size)
     
     # Get the cell coordinates to highlight based on the index (row, col)
-    top_left, bottom_right = cells[cell[1] + 3 * cell[0]]  # Flatten the 3x3 grid into 1D list
-
-    # Create an overlay for semi-transparency
-    overlay = frame.copy()
-    cv2.rectangle(overlay, top_left, bottom_right, (255, 255, 255), -1)
+    (x1, y1), (x2, y2) = cells[cell[1] + 3 * cell[0]]  # Flatten the 3x3 grid into 1D list
 
-    # Apply the overlay with alpha blending
-    cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+    # Blend white into the cell only, in place (roi is a view of the frame)
+    roi = frame[y1:y2, x1:x2]
+    if roi.size: cv2.addWeighted(roi, 1 - alpha, roi, 0, 255 * alpha, roi)
 
     return frame
@@ -0,0 +1,59 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import cv2
+from config.settings import DNN_FACE_MODEL, DNN_FACE_CONFIG, DNN_FACE_CONFIDENCE, FACE_MIN_SIZE
+from object_detector.detectors.FaceDetector import FaceDetector
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+
+# 
+# The "DnnFaceDetector" class
+# 
+
+class DnnFaceDetector(FaceDetector):
+    """
+    CNN backend through `cv2.dnn`, using the ResNet-10 SSD face model
+    (`res10_300x300_ssd_iter_140000.caffemodel` + `deploy.prototxt`).
+    Model files are read from the local directory, nothing is downloaded.
+    """
+
+    name = "dnn"
+    INPUT_SIZE = (300, 300)
+    MEAN = (104.0, 177.0, 123.0)
+
+    def __init__(self, model=DNN_FACE_MODEL, config=DNN_FACE_CONFIG, confidence=DNN_FACE_CONFIDENCE, min_size=FACE_MIN_SIZE):
+        model = os.path.join(PROJECT_DIR, model)
+        config = os.path.join(PROJECT_DIR, config)
+        if not os.path.isfile(model) or not os.path.isfile(config):
+            raise FileNotFoundError(f"DNN face model not found at '{model}' / '{config}'")
+
+        self.net = cv2.dnn.readNet(model, config)
+        self.confidence = confidence
+        self.min_size = min_size
+
+    def detect(self, image, input_scale=1.0):
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        height, width = image.shape[:2]
+
+        blob = cv2.dnn.blobFromImage(cv2.resize(image, self.INPUT_SIZE), 1.0, self.INPUT_SIZE, self.MEAN)
+        self.net.setInput(blob)
+        detections = self.net.forward()
+
+        faces = []
+        for i in range(detections.shape[2]):
+            if detections[0, 0, i, 2] < self.confidence:
+                continue
+
+            x1, y1, x2, y2 = detections[0, 0, i, 3:7]
+            x1, y1 = max(0, int(x1 * width)), max(0, int(y1 * height))
+            x2, y2 = min(width, int(x2 * width)), min(height, int(y2 * height))
+            w, h = x2 - x1, y2 - y1
+
+            if w >= self.min_size[0] * input_scale and h >= self.min_size[1] * input_scale:
+                faces.append((x1, y1, w, h))
+
+        return faces
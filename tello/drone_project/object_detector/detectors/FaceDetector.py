@@ -0,0 +1,55 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from config.settings import FACE_DETECTOR
+
+# 
+# The "FaceDetector" base class
+# 
+
+class FaceDetector:
+    """
+    Common interface of the face detector backends.
+    `detect(image)` takes a BGR or grayscale frame and returns a list of
+    (x, y, w, h) boxes in the coordinates of that frame. Pass `input_scale`
+    when the frame is a downscaled copy, so size limits given in
+    full-resolution pixels (FACE_MIN_SIZE) still apply.
+    """
+
+    name = None
+
+    def detect(self, image, input_scale=1.0):
+        raise NotImplementedError
+
+    def __call__(self, image, input_scale=1.0):
+        return self.detect(image, input_scale)
+
+# 
+# Factory
+# 
+
+_detectors = {}
+
+def get_face_detector(name=FACE_DETECTOR, **kwargs):
+    """
+    Return a shared detector instance for the given backend name.
+    Backends are built once per process, so callers can ask for a detector
+    on every frame without reloading model files.
+    """
+    key = (name, tuple(sorted(kwargs.items())))
+    if key in _detectors:
+        return _detectors[key]
+
+    if name == "haar":
+        from object_detector.detectors.HaarFaceDetector import HaarFaceDetector
+        detector = HaarFaceDetector(**kwargs)
+    elif name == "dnn":
+        from object_detector.detectors.DnnFaceDetector import DnnFaceDetector
+        detector = DnnFaceDetector(**kwargs)
+    else:
+        raise ValueError(f"Face detector '{name}' is not implemented.")
+
+    _detectors[key] = detector
+    return detector
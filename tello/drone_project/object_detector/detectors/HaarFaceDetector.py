@@ -0,0 +1,49 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import cv2
+from config.settings import FACE_DETECTION_SCALE, FACE_MIN_SIZE
+from object_detector.detectors.FaceDetector import FaceDetector
+
+# 
+# The "HaarFaceDetector" class
+# 
+
+class HaarFaceDetector(FaceDetector):
+    """
+    Haar cascade backend.
+    The cascade is loaded once per process, and detection runs on a
+    downscaled copy of the frame so `detectMultiScale` builds a much
+    smaller pyramid. Boxes are mapped back to the input resolution.
+    """
+
+    name = "haar"
+    CASCADE_FILE = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+
+    _cascade = None
+
+    def __init__(self, scale=FACE_DETECTION_SCALE, min_size=FACE_MIN_SIZE, scale_factor=1.1, min_neighbors=5):
+        self.scale = scale
+        self.min_size = min_size
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+
+        if HaarFaceDetector._cascade is None:
+            HaarFaceDetector._cascade = cv2.CascadeClassifier(self.CASCADE_FILE)
+        self.cascade = HaarFaceDetector._cascade
+
+    def detect(self, image, input_scale=1.0):
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        # downscale; `scale` is relative to full resolution, so an input that is already downscaled is resized less
+        scale = min(1, self.scale / input_scale) if 0 < self.scale < 1 else 1
+        if scale != 1:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        min_size = tuple(max(1, int(s * scale * input_scale)) for s in self.min_size)
+
+        faces = self.cascade.detectMultiScale(gray, scaleFactor=self.scale_factor, minNeighbors=self.min_neighbors, minSize=min_size)
+
+        # map back to the input resolution
+        return [tuple(int(round(v / scale)) for v in face) for face in faces]
@@ -0,0 +1,3 @@
+# from .FaceDetector import FaceDetector, get_face_detector
+# from .HaarFaceDetector import HaarFaceDetector
+# from .DnnFaceDetector import DnnFaceDetector
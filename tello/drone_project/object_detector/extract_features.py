@@ -1,111 +1,192 @@
 import argparse
+import hashlib
+import json
 import os
+import sys
 import time
 import torch
-import torch.nn as nn
-import torchvision.transforms as transforms
 import numpy as np
 import cv2
 import pickle
-from .light_cnn import LightCNN_9Layers, LightCNN_29Layers, LightCNN_29Layers_v2
+from concurrent.futures import ProcessPoolExecutor
+from .models.light_cnn import load_embedding_model
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from object_detector.detectors.FaceDetector import get_face_detector
 
 parser = argparse.ArgumentParser(description='PyTorch LightCNN Feature Extraction')
 parser.add_argument('--arch', '-a', metavar='ARCH', default='LightCNN')
 parser.add_argument('--cuda', '-c', default=False, action='store_true', help='Use CUDA if available')
 parser.add_argument('--resume', default='F:\Python Project\LightCNN\LightCNN_29Layers_checkpoint.pth', type=str, metavar='PATH',
                     help='Path to the pre-trained checkpoint model')
-parser.add_argument('--model', default='LightCNN-29', type=str, metavar='Model', help='Model type: LightCNN-9, LightCNN-29')
-parser.add_argument('--root_path', default='F:\Python Project\eagle-wings-drone-project\tello\drone_project\data\dataset', type=str, metavar='PATH', 
+parser.add_argument('--model', default='LightCNN-29', type=str, metavar='Model', help='Model type: LightCNN-9, LightCNN-29, LightCNN-29v2')
+parser.add_argument('--root_path', default='F:\Python Project\eagle-wings-drone-project\tello\drone_project\data\dataset', type=str, metavar='PATH',
                     help='Root path of face images.')
-parser.add_argument('--save_path', default='F:\Python Project\eagle-wings-drone-project\tello\drone_project\data\extracted_features', type=str, metavar='PATH', 
+parser.add_argument('--save_path', default='F:\Python Project\eagle-wings-drone-project\tello\drone_project\data\extracted_features', type=str, metavar='PATH',
                     help='Save path for extracted features.')
-parser.add_argument('--num_classes', default=79077, type=int, metavar='N', help='Number of classes for the model.')  # FIXED
-
-def detect_faces(image):
-    """Detect faces in the input image using OpenCV Haar Cascade."""
-    face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-    faces = face_cascade.detectMultiScale(image, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
-    return faces
+parser.add_argument('--detector', default=None, type=str, help='Face detector backend: haar, dnn (defaults to settings.FACE_DETECTOR)')
+parser.add_argument('--workers', default=os.cpu_count(), type=int, help='Processes used for decoding and face detection')
+parser.add_argument('--batch_size', default=32, type=int, help='Faces per embedding batch')
+parser.add_argument('--force', default=False, action='store_true', help='Recompute features of unchanged images')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+MANIFEST_FILE = 'manifest.json'
+
+def detect_faces(image, detector=None):
+    """Detect faces in the input image using the shared face detector backend."""
+    face_detector = get_face_detector(detector) if detector else get_face_detector()
+    return face_detector.detect(image)
+
+def file_hash(path):
+    """Content hash used by the manifest to skip unchanged images."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def prepare_face(img_path, detector=None):
+    """
+    Worker step: decode the image, detect faces and return the largest face
+    as a 128x128 grayscale crop, or an error message.
+    """
+    img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None, "Error reading image"
+
+    faces = detect_faces(img, detector)
+    if len(faces) == 0:
+        return None, "No faces detected"
+
+    x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+    return cv2.resize(img[y:y+h, x:x+w], (128, 128)), None
+
+def feature_path(save_path, person_name, img_name):
+    return os.path.splitext(os.path.join(save_path, person_name, img_name))[0] + '.feat'
 
 def save_feature(save_path, person_name, img_name, features):
     """Save the extracted features for a face image."""
     person_dir = os.path.join(save_path, person_name)
     os.makedirs(person_dir, exist_ok=True)  # Create directory if it doesn't exist
-    fname = os.path.splitext(os.path.join(person_dir, img_name))[0] + '.feat'
+    fname = feature_path(save_path, person_name, img_name)
     try:
         with open(fname, 'wb') as fid:
             pickle.dump(features, fid)
-        print(f"Saved features for {person_name}/{img_name} at {fname}")
     except Exception as e:
         print(f"Error saving features for {person_name}/{img_name}: {e}")
 
-def main():
-    args = parser.parse_args()
-
-    # Load the model
-    if args.model == 'LightCNN-9':
-        model = LightCNN_9Layers(num_classes=args.num_classes)
-    elif args.model == 'LightCNN-29':
-        model = LightCNN_29Layers(num_classes=args.num_classes)
-    elif args.model == 'LightCNN-29v2':
-        model = LightCNN_29Layers_v2(num_classes=args.num_classes)
-    else:
-        raise ValueError(f"Invalid model type: {args.model}")
-
-    # Load checkpoint
-    if os.path.isfile(args.resume):
-        print(f"Loading checkpoint from '{args.resume}'")
-        checkpoint = torch.load(args.resume, map_location=torch.device('cpu'))
-        state_dict = {k.replace('module.', ''): v for k, v in checkpoint['state_dict'].items()}
-        model.load_state_dict(state_dict)
-    else:
-        raise FileNotFoundError(f"No checkpoint found at '{args.resume}'")
-
-    model.eval()
-
-    # Traverse through dataset folders
-    for person_name in os.listdir(args.root_path):
-        person_path = os.path.join(args.root_path, person_name)
+def load_manifest(save_path):
+    try:
+        with open(os.path.join(save_path, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(save_path, manifest):
+    os.makedirs(save_path, exist_ok=True)
+    tmp = os.path.join(save_path, MANIFEST_FILE + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, os.path.join(save_path, MANIFEST_FILE))
+
+def list_images(root_path):
+    """Yield (person_name, img_name, img_path) for every image of the dataset."""
+    for person_name in sorted(os.listdir(root_path)):
+        person_path = os.path.join(root_path, person_name)
         if not os.path.isdir(person_path):  # Skip files
             continue
 
-        img_list = [f for f in os.listdir(person_path) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp'))]
+        img_list = [f for f in sorted(os.listdir(person_path)) if f.lower().endswith(IMAGE_EXTENSIONS)]
         if not img_list:
             print(f"No images found for {person_name} in {person_path}")
             continue
 
-        print(f"Processing {len(img_list)} images for person: {person_name}")
-        
-        transform = transforms.Compose([transforms.ToTensor()])
-        input_tensor = torch.zeros(1, 1, 128, 128)
-
         for img_name in img_list:
-            img_path = os.path.join(person_path, img_name)
-            img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
-
-            if img is None:
-                print(f"Error reading image: {img_name}")
-                continue
-
-            faces = detect_faces(img)
-            if len(faces) == 0:
-                print(f"No faces detected in {img_name}")
-                continue
-
-            for (x, y, w, h) in faces:
-                face = img[y:y+h, x:x+w]
-                face_resized = cv2.resize(face, (128, 128))
-                face_resized = np.reshape(face_resized, (128, 128, 1))
-                face_resized = transform(face_resized)
-                input_tensor[0, :, :, :] = face_resized
-
-                start_time = time.time()
-                with torch.no_grad():
-                    _, features = model(input_tensor)
-                elapsed_time = time.time() - start_time
-
-                print(f"Processed {img_name} in {elapsed_time:.4f} seconds")
-                save_feature(args.save_path, person_name, img_name, features.cpu().numpy()[0])
+            yield person_name, img_name, os.path.join(person_path, img_name)
+
+def embed_batch(model, faces):
+    """Run one batch of 128x128 crops through the embedding model."""
+    batch = torch.from_numpy(np.stack(faces)).float().div_(255).unsqueeze(1)
+    with torch.no_grad():
+        _, features = model(batch)
+    return features.cpu().numpy()
+
+def main():
+    args = parser.parse_args()
+    start_time = time.time()
+
+    # Load the embedding-only model
+    if not os.path.isfile(args.resume):
+        raise FileNotFoundError(f"No checkpoint found at '{args.resume}'")
+    print(f"Loading checkpoint from '{args.resume}'")
+    model = load_embedding_model(args.resume, args.model)
+
+    # Work out what changed since the last run
+    manifest = load_manifest(args.save_path)
+    current, pending = {}, []
+    for person_name, img_name, img_path in list_images(args.root_path):
+        key = f"{person_name}/{img_name}"
+        entry = {'hash': file_hash(img_path), 'model': args.model}
+        current[key] = entry
+
+        # unchanged: features saved, or known to have no usable face
+        previous = manifest.get(key, {})
+        unchanged = all(previous.get(k) == v for k, v in entry.items())
+        if not args.force and unchanged and ('error' in previous or os.path.isfile(feature_path(args.save_path, person_name, img_name))):
+            continue
+        pending.append((key, person_name, img_name, img_path))
+
+    # Drop features of images that were removed from the dataset
+    for key in set(manifest) - set(current):
+        person_name, img_name = key.split('/', 1)
+        fname = feature_path(args.save_path, person_name, img_name)
+        if os.path.isfile(fname): os.remove(fname)
+
+    print(f"{len(current)} images, {len(current) - len(pending)} unchanged, {len(pending)} to process")
+
+    # Decode + detect in a process pool, embed in batches as crops arrive
+    processed, failed = 0, 0
+    batch, batch_items = [], []
+    pending_keys = {p[0] for p in pending}
+    manifest = {k: v for k, v in manifest.items() if k in current and k not in pending_keys}
+
+    def flush():
+        nonlocal processed
+        if not batch: return
+        for (key, person_name, img_name), features in zip(batch_items, embed_batch(model, batch)):
+            save_feature(args.save_path, person_name, img_name, features)
+            manifest[key] = current[key]
+        processed += len(batch)
+        batch.clear(); batch_items.clear()
+
+        # keep the progress of an interrupted run
+        save_manifest(args.save_path, manifest)
+
+        elapsed = time.time() - pool_start
+        print(f"[{processed + failed}/{len(pending)}] {processed / elapsed:.1f} faces/s")
+
+    pool_start = time.time()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            paths = [p[3] for p in pending]
+            for (key, person_name, img_name, _), (face, error) in zip(pending, pool.map(prepare_face, paths, [args.detector] * len(paths), chunksize=4)):
+                if face is None:
+                    print(f"{error} in {person_name}/{img_name}")
+                    failed += 1
+
+                    # remembered, so reruns skip it until the image changes; drop features of its old content
+                    manifest[key] = dict(current[key], error=error)
+                    fname = feature_path(args.save_path, person_name, img_name)
+                    if os.path.isfile(fname): os.remove(fname)
+                    continue
+
+                batch.append(face)
+                batch_items.append((key, person_name, img_name))
+                if len(batch) >= args.batch_size: flush()
+
+            flush()
+    finally:
+        save_manifest(args.save_path, manifest)
+
+    elapsed = time.time() - start_time
+    print(f"Done: {processed} extracted, {failed} failed, {len(current) - len(pending)} skipped in {elapsed:.2f}s")
 
 if __name__ == '__main__':
     main()
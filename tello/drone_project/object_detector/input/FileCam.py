@@ -0,0 +1,59 @@
+import cv2
+import os
+import sys; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from core.Camera import Camera, CameraInitializationError
+
+class FileCam(Camera):
+    """
+    Reads a recorded video file or a directory of images through the same
+    `frame()` interface as the live cameras. `frame()` returns None once
+    the source is exhausted (`is_finished`), and `timestamp()` gives the
+    source time of the last frame in seconds.
+    """
+
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+    def __init__(self, source, frame_rate=30, auto_start=True):
+        self.images = None
+        self.index = -1
+        self.frame_rate = frame_rate
+        self.is_finished = False
+        super().__init__(source, auto_start)
+
+    def start(self):
+        if os.path.isdir(self.source):
+            self.images = sorted(
+                os.path.join(self.source, f) for f in os.listdir(self.source) if f.lower().endswith(self.IMAGE_EXTENSIONS)
+            )
+            if not self.images:
+                raise CameraInitializationError(f"No images found in {self.source}")
+            self.is_opened = True
+            return
+
+        super().start()
+        self.frame_rate = self.cap.get(cv2.CAP_PROP_FPS) or self.frame_rate
+
+    def frame(self):
+        if self.is_finished:
+            return None
+
+        if self.images is not None:
+            self.index += 1
+            if self.index >= len(self.images):
+                self.is_finished = True
+                return None
+            return cv2.imread(self.images[self.index])
+
+        ret, frame = self.cap.read()
+        if not ret:
+            self.is_finished = True
+            return None
+        self.index += 1
+        return frame
+
+    def timestamp(self):
+        return max(0, self.index) / self.frame_rate
+
+    def __len__(self):
+        if self.images is not None: return len(self.images)
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)) if self.cap else 0
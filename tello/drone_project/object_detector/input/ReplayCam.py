@@ -0,0 +1,85 @@
+import os
+import time
+import sys; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from object_detector.input.FileCam import FileCam
+from core.Camera import CameraInitializationError
+from core.util.classes.FlightRecorder import load_flight_log
+
+class ReplayCam(FileCam):
+    """
+    Plays back a flight recorded by FlightRecorder (`<path>.avi` + `<path>.bin`)
+    or any video file, with the original frame timing.
+
+    speed=1  : real time, like a live camera (frames due in the meantime are skipped)
+    speed=N  : N times faster
+    speed=0  : as fast as possible, every frame once, in order (deterministic)
+
+    `frame()` returns None once the recording is over, unless `loop` is set.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False, auto_start=True):
+        if not path:
+            raise CameraInitializationError("ReplayCam needs a recording: set REPLAY_PATH to a flight recording or video file")
+        base = os.path.splitext(path)[0] if path.endswith(('.avi', '.bin')) else path
+        video = f"{base}.avi" if os.path.isfile(f"{base}.avi") else path
+        log = f"{base}.bin"
+
+        self.speed = speed
+        self.loop = loop
+        self.timestamps = None
+        if os.path.isfile(log):
+            times = load_flight_log(log)['time']
+            self.timestamps = times - times[0] if len(times) else None
+
+        self.current = None
+        self.started_at = None
+        super().__init__(video, auto_start=auto_start)
+
+    def time_of(self, index):
+        if self.timestamps is not None and index < len(self.timestamps):
+            return float(self.timestamps[index])
+        return index / self.frame_rate
+
+    def timestamp(self):
+        return self.time_of(max(0, self.index))
+
+    def restart(self):
+        self.stop()
+        self.index = -1
+        self.current = None
+        self.started_at = None
+        self.is_finished = False
+        self.start()
+
+    def frame(self):
+        if self.is_finished:
+            if not self.loop: return None
+            self.restart()
+
+        # as fast as possible: every frame, in order
+        if not self.speed:
+            self.current = super().frame()
+            return self.current
+
+        # timed: advance to the last frame due at the current replay time
+        if self.started_at is None:
+            self.started_at = time.time()
+            self.current = super().frame()
+            return self.current
+
+        replay_time = (time.time() - self.started_at) * self.speed
+        while self.time_of(self.index + 1) <= replay_time:
+            if self.images is None and self.time_of(self.index + 2) <= replay_time:
+                # skip without decoding
+                if not self.cap.grab():
+                    self.is_finished = True
+                    break
+                self.index += 1
+                continue
+
+            frame = super().frame()
+            if frame is None: break
+            self.current = frame
+
+        if self.is_finished and not self.loop: return None
+        return self.current
@@ -11,6 +11,8 @@ from config.settings import debug
 
 class CSRTTracker:
 
+    ACCEPTS_GRAYSCALE = True
+
     # 
     # Constructor
     # 
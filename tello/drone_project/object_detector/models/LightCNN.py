@@ -4,7 +4,7 @@ import os
 import torch
 import torch.nn as nn
 import torchvision.transforms as transforms
-from light_cnn import LightCNN_29Layers
+from object_detector.models.light_cnn import LightCNN_29Layers
 from scipy.spatial.distance import cosine
 import pickle
 import time
@@ -3,10 +3,12 @@ import numpy as np
 import os
 import torch
 import torchvision.transforms as transforms
-from .light_cnn import LightCNN_29Layers
-from scipy.spatial.distance import cosine
+from .light_cnn import load_embedding_model
 import pickle
 from navigation_plan.navigators.GridNavigator import GridNavigator
+from object_detector.detectors.FaceDetector import get_face_detector
+from config.settings import LIGHTCNN_ARCH
+from user_interface.util.Overlay import Overlay
 from PyQt6.QtCore import QObject, pyqtSignal
 
 class LightCNNTracker(QObject):
@@ -15,10 +17,14 @@ class LightCNNTracker(QObject):
     centerUpdated = pyqtSignal(tuple)    # Emits (x_center, y_center)
     trackingLost = pyqtSignal()          # Emits when tracking is lost
 
+    ACCEPTS_GRAYSCALE = True # the embedding model is grayscale anyway
+    input_scale = 1.0        # set by ScaledTracker when frames are downscaled
+
     def __init__(self, interface, 
                  model_path=os.path.join(os.path.dirname(__file__), '..', 'LightCNN_29Layers_checkpoint.pth'), 
                  feature_dir=os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'extracted_features'),
-                 similarity_threshold=0.7):
+                 similarity_threshold=0.7,
+                 arch=LIGHTCNN_ARCH):
         """
         Initialize the LightCNNTracker.
         Loads the pre-trained LightCNN model, feature database,
@@ -28,13 +34,8 @@ class LightCNNTracker(QObject):
         self.interface = interface
         self.similarity_threshold = similarity_threshold
 
-        # Load the pre-trained LightCNN model
-        self.model = LightCNN_29Layers(num_classes=79077)
-        checkpoint = torch.load(model_path, map_location=torch.device('cpu'))
-        state_dict = checkpoint['state_dict']
-        state_dict = {k.replace('module.', ''): v for k, v in state_dict.items()}
-        self.model.load_state_dict(state_dict)
-        self.model.eval()
+        # Load the pre-trained LightCNN model without its classifier head
+        self.model = load_embedding_model(model_path, arch)
 
         # Load feature database: {person_name: [feature_vectors]}
         self.feature_db = {}
@@ -48,9 +49,15 @@ class LightCNNTracker(QObject):
                             feature = pickle.load(f)
                             self.feature_db[folder].append(feature)
 
+        # Stack the database into one normalised matrix for vectorised cosine distances
+        self.gallery_labels = [name for name, feats in self.feature_db.items() for _ in feats]
+        gallery = [feat for feats in self.feature_db.values() for feat in feats]
+        self.gallery = np.array(gallery, dtype=np.float32) if gallery else np.zeros((0, 256), dtype=np.float32)
+        self.gallery /= np.maximum(np.linalg.norm(self.gallery, axis=1, keepdims=True), 1e-12)
+
         # Preprocessing transformation and face detector
         self.transform = transforms.Compose([transforms.ToTensor()])
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        self.face_detector = get_face_detector()
 
         # Tracking state initialization
         self.boundary = None  # (x, y, w, h)
@@ -59,6 +66,7 @@ class LightCNNTracker(QObject):
 
         # Store detections for potential face selection
         self.detections = []
+        self.annotations = [] # overlay primitives of the last frame
 
         # Setup Grid Navigator for movement control
         self.navigator = GridNavigator(self)
@@ -72,23 +80,23 @@ class LightCNNTracker(QObject):
         Preprocess the face image and extract features using the LightCNN model.
         Returns a feature vector.
         """
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         resized = cv2.resize(gray, (128, 128))
         img_tensor = self.transform(resized).unsqueeze(0)  # Add batch dimension
         with torch.no_grad():
             features = self.model(img_tensor)
-        # Assuming the second output contains the desired feature vector
+        # The second output is the embedding (the model has no classifier head)
         return features[1].data.cpu().numpy()[0]
 
     def recognize_face(self, frame):
         """
-        Detect faces in the frame using Haar cascades, extract features,
-        compare against the feature database, and annotate the frame.
+        Detect faces in the frame using the configured face detector, extract features,
+        compare against the feature database, and collect the annotations to display.
         Auto-select if only one face is detected.
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+        faces = self.face_detector.detect(frame, self.input_scale)
         self.detections = []  # Clear previous detections
+        self.annotations = []
 
         if len(faces) == 0:
             self.on_lost()
@@ -101,13 +109,12 @@ class LightCNNTracker(QObject):
             
             best_match = "Unknown"
             best_similarity = float('inf')
-            # Compare against each feature in the database
-            for person_name, db_features in self.feature_db.items():
-                for db_feat in db_features:
-                    similarity = cosine(features, db_feat)
-                    if similarity < best_similarity:
-                        best_similarity = similarity
-                        best_match = person_name
+            # Compare against every feature in the database at once (cosine distance)
+            if len(self.gallery_labels):
+                distances = 1 - self.gallery @ (features / max(np.linalg.norm(features), 1e-12))
+                best = int(np.argmin(distances))
+                best_similarity = float(distances[best])
+                best_match = self.gallery_labels[best]
 
             # Use threshold to determine if recognition is confident
             if best_similarity >= self.similarity_threshold:
@@ -123,9 +130,9 @@ class LightCNNTracker(QObject):
             }
             self.detections.append(detection)
 
-            # Annotate the frame with bounding box and label
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-            cv2.putText(frame, best_match, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            # Bounding box and label
+            self.annotations.append(Overlay.rect((x, y), (x + w, y + h), (0, 255, 0), 2))
+            self.annotations.append(Overlay.text(best_match, (x, y - 10), (0, 255, 0)))
         
         # Auto-select if only one face is detected
         if len(self.detections) == 1:
@@ -166,21 +173,26 @@ class LightCNNTracker(QObject):
     def on_frame(self, frame):
         """
         Process each frame:
-          - Recognize and annotate faces.
-          - Draw visual aids if tracking is active.
+          - Recognize faces.
+          - Publish the annotations and visual aids as an overlay layer
+            (the frame itself is not drawn on).
           - Call the navigator to adjust movement.
-        Returns the processed frame.
+        Returns the frame.
         """
+        self.annotations = []
         frame = self.recognize_face(frame)
         
         if self.is_tracking and self.center is not None:
             frame_h, frame_w = frame.shape[:2]
             frame_center = (frame_w // 2, frame_h // 2)
-            # Draw frame center lines
-            cv2.line(frame, (frame_center[0], 0), (frame_center[0], frame_h), (0, 255, 0), 1)
-            cv2.line(frame, (0, frame_center[1]), (frame_w, frame_center[1]), (0, 255, 0), 1)
-            # Draw line from frame center to target center
-            cv2.line(frame, frame_center, self.center, (255, 0, 0), 2)
+            self.annotations += [
+                # Frame center lines
+                Overlay.line((frame_center[0], 0), (frame_center[0], frame_h), (0, 255, 0), 1),
+                Overlay.line((0, frame_center[1]), (frame_w, frame_center[1]), (0, 255, 0), 1),
+                # Line from frame center to target center
+                Overlay.line(frame_center, self.center, (255, 0, 0), 2),
+            ]
+        self.interface.set_layer('tracker', self.annotations)
         
         # Call navigator logic for movement control
         self.navigator.navigate(frame)
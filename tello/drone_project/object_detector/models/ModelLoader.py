@@ -0,0 +1,98 @@
+import threading
+import time
+
+from . import get_model_class, build_model, load_model_process
+
+#
+# The "DeferredInterface" class
+#
+
+class DeferredInterface:
+    """
+    Stand-in interface handed to a tracker built before the real interface
+    exists. Attribute access is forwarded once `bind()` has been called.
+    """
+
+    def __init__(self):
+        self._target = None
+
+    def bind(self, interface):
+        self._target = interface
+
+    def __getattr__(self, name):
+        if self._target is None:
+            raise AttributeError(f"Interface not bound yet (accessed '{name}')")
+        return getattr(self._target, name)
+
+#
+# The "ModelLoader" class
+#
+
+class ModelLoader(threading.Thread):
+    """
+    Imports and builds the selected tracker in a background thread, so
+    checkpoints and feature databases load while the camera and interface
+    come up. Falls back to `fallback` if the selected model fails.
+    With `process` (default: INFERENCE_PROCESS) the tracker is built and
+    run in a worker process instead.
+    """
+
+    def __init__(self, name, fallback=None, auto_start=True, process=None, **kwargs):
+        super().__init__(name=f"ModelLoader[{name}]", daemon=True)
+
+        # Arguments
+        self.model_name = name
+        self.fallback = fallback
+        self.kwargs = kwargs
+        if process is None:
+            from config.settings import INFERENCE_PROCESS
+            process = INFERENCE_PROCESS
+        self.process = process
+
+        # Results
+        self.interface = DeferredInterface()
+        self.model = None
+        self.loaded_name = None
+        self.error = None
+        self.timings = {}
+
+        if auto_start:
+            self.start()
+
+    def build(self, name):
+        start = time.perf_counter()
+        if self.process:
+            model = load_model_process(name, self.interface, **self.kwargs)
+            self.timings[f"{name}.process"] = time.perf_counter() - start
+            return model
+
+        model_class = get_model_class(name)
+        imported = time.perf_counter()
+        model = build_model(model_class, self.interface, **self.kwargs)
+        built = time.perf_counter()
+
+        self.timings[f"{name}.import"] = imported - start
+        self.timings[f"{name}.build"] = built - imported
+        return model
+
+    def run(self):
+        try:
+            self.model = self.build(self.model_name)
+            self.loaded_name = self.model_name
+        except Exception as e:
+            self.error = e
+            if not self.fallback or self.fallback == self.model_name:
+                return
+            try:
+                self.model = self.build(self.fallback)
+                self.loaded_name = self.fallback
+            except Exception as fallback_error:
+                self.error = fallback_error
+
+    def get(self, interface, timeout=None):
+        """Wait for the model, bind it to the real interface and return it."""
+        self.join(timeout)
+        if self.model is None:
+            raise RuntimeError(f"Model {self.model_name} could not be loaded: {self.error}")
+        self.interface.bind(interface)
+        return self.model
@@ -0,0 +1,279 @@
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+import multiprocessing
+import threading
+import traceback
+import numpy as np
+from config.settings import INFERENCE_PROCESS_TIMEOUT, INFERENCE_PROCESS_STARTUP, FRAME_RING_SLOT_SIZE, debug
+from core.util.classes.FrameRing import FrameRing
+
+#
+# The "RecordingInterface" class (child process)
+#
+
+class RecordingInterface:
+    """
+    Interface handed to the tracker inside the worker process. It keeps the
+    state trackers read (boundary, boundary_frame, center) and records the
+    calls they make, so the parent can replay them on the real interface.
+    """
+
+    def __init__(self):
+        self.boundary = None
+        self.boundary_frame = None
+        self.center = None
+        self.calls = []
+
+    def update_boundary(self, x, y=None, w=None, h=None, **kwargs):
+        self.boundary = tuple(x) if y is None else (x, y, w, h)
+        self.calls.append(('update_boundary', self.boundary, kwargs))
+
+    def update_center(self, cx, cy=None, **kwargs):
+        self.center = tuple(cx) if cy is None else (cx, cy)
+        self.calls.append(('update_center', self.center, kwargs))
+
+    def take_calls(self):
+        calls, self.calls = self.calls, []
+        return calls
+
+    def __getattr__(self, name):
+        # show_* / hide_* / set_layer and anything else: recorded as is
+        def record(*args, **kwargs): self.calls.append((name, args, kwargs))
+        return record
+
+#
+# Worker (child process)
+#
+
+def run_worker(model_name, build_kwargs, conn):
+    from object_detector.models import load_model
+
+    rings = {} # attached FrameRings by name
+    try:
+        interface = RecordingInterface()
+        tracker = load_model(model_name, interface, **build_kwargs)
+        conn.send(('ready', None))
+
+        def frame_of(ring_name, seq, copy):
+            if ring_name not in rings: rings[ring_name] = FrameRing.attach(ring_name)
+            frame, _ = rings[ring_name].read(seq, copy)
+            if frame is None: raise LookupError(f"frame {seq} was overwritten")
+            return frame
+
+        def result():
+            return {'boundary': tracker.boundary, 'center': tracker.center, 'calls': interface.take_calls()}
+
+        while True:
+            message = conn.recv()
+            kind = message[0]
+            if kind == 'stop': break
+
+            try:
+                if kind == 'frame':
+                    _, ring_name, seq, copy = message
+                    tracker.on_frame(frame_of(ring_name, seq, copy))
+                    conn.send(('result', result()))
+
+                elif kind == 'select':
+                    _, boundary, ring_name, seq, _ = message
+                    interface.boundary = boundary
+                    interface.boundary_frame = frame_of(ring_name, seq, True) # kept by the tracker
+                    tracker.set_object()
+                    conn.send(('result', result()))
+
+                elif kind == 'call':
+                    _, name, args = message
+                    value = getattr(tracker, name)(*args)
+                    conn.send(('value', value))
+
+            except Exception as e:
+                if debug: traceback.print_exc()
+                conn.send(('error', f"{type(e).__name__}: {e}"))
+
+    except Exception as e:
+        traceback.print_exc()
+        try: conn.send(('error', f"{type(e).__name__}: {e}"))
+        except (OSError, ValueError): pass
+    finally:
+        for ring in rings.values(): ring.close()
+
+#
+# The "ProcessTracker" class
+#
+
+class ProcessTracker:
+    """
+    Runs the tracker `model_name` in a worker process, so its inference does
+    not compete for the GIL with the UI, navigation and rc threads. Frames
+    go through shared memory, only their FrameRing name and seq through the
+    pipe: frames the pipeline already published to its ring (`set_ring`)
+    are read from there, others are written to a private two-slot ring.
+    The worker answers with the tracker's boundary / center and the
+    interface calls it made, which are replayed here on the real interface.
+
+    A worker that crashes or does not answer within `timeout` seconds is
+    killed and restarted (`stats['restarts']`), and the last selection is
+    sent again so tracking resumes. The private ring's slots hold
+    `slot_size` bytes (default FRAME_RING_SLOT_SIZE, a Tello frame); only a
+    larger frame restarts the worker with bigger slots.
+    """
+
+    def __init__(self, model_name, interface, timeout=INFERENCE_PROCESS_TIMEOUT, startup_timeout=INFERENCE_PROCESS_STARTUP, slot_size=None, **build_kwargs):
+
+        # Arguments
+        self.model_name = model_name
+        self.interface = interface
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.build_kwargs = build_kwargs
+
+        # Results
+        self.boundary = None
+        self.center = None
+
+        # Worker
+        self.context = multiprocessing.get_context("spawn")
+        self.lock = threading.Lock() # one request in flight (inference thread vs UI thread)
+        self.process = None
+        self.conn = None
+        self.ring = None        # private ring, one request in flight
+        self.shared_ring = None # the pipeline's ring, see `set_ring`
+        self.slot_size = slot_size or FRAME_RING_SLOT_SIZE
+        self.selection = None # (boundary, frame) to restore after a restart
+        self.stats = {'frames': 0, 'shared': 0, 'restarts': 0, 'failures': 0}
+
+        # Fail here (e.g. for the loader's fallback) if the tracker cannot be built
+        self.start_worker()
+
+    #
+    # Worker
+    #
+
+    def start_worker(self, slot_size=None):
+        self.slot_size = max(self.slot_size, slot_size or 0)
+        self.ring = FrameRing(2, self.slot_size)
+        self.conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(
+            target=run_worker,
+            args=(self.model_name, self.build_kwargs, child_conn),
+            name=f"tracker-{self.model_name}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+        kind, payload = self.receive(self.startup_timeout)
+        if kind != 'ready':
+            self.stop_worker()
+            raise RuntimeError(f"Tracker process for {self.model_name} failed to start: {payload}")
+
+    def stop_worker(self):
+        if self.process is not None:
+            try: self.conn.send(('stop',))
+            except (OSError, ValueError): pass
+            self.process.join(timeout=0.5)
+            if self.process.is_alive(): self.process.kill()
+            self.process.join(timeout=0.5)
+            self.conn.close()
+        if self.ring is not None:
+            self.ring.close()
+        self.process, self.conn, self.ring = None, None, None
+
+    def restart(self, reason, slot_size=None):
+        print(f"[WARN] Restarting tracker process ({reason})")
+        self.stop_worker()
+        self.stats['restarts'] += 1
+        self.boundary, self.center = None, None
+        self.start_worker(slot_size)
+
+        if self.selection:
+            self.apply(self.request_selection(*self.selection, retry=False))
+
+    def close(self):
+        with self.lock: self.stop_worker()
+
+    def receive(self, timeout):
+        """The worker's next reply, or ('error', reason) if it died or timed out."""
+        try:
+            if not self.conn.poll(timeout):
+                return 'error', f"no reply within {timeout}s"
+            return self.conn.recv()
+        except (EOFError, OSError) as e:
+            return 'error', f"worker exited ({e})"
+
+    def publish(self, frame):
+        """(ring name, seq, copy) of `frame` in shared memory, writing it to the private ring if needed."""
+        seq = self.shared_ring.seq_of(frame) if self.shared_ring else 0
+        if seq:
+            # the pipeline keeps writing its ring, the worker copies
+            self.stats['shared'] += 1
+            return self.shared_ring.name, seq, True
+
+        if frame.nbytes > self.ring.slot_size: self.restart("larger frames", frame.nbytes)
+        return self.ring.name, self.ring.publish(np.ascontiguousarray(frame)), False
+
+    def request(self, message, frame=None, retry=True):
+        """
+        Send a request (with `frame` in shared memory) and return the reply,
+        or None if it failed. A dead or hung worker is restarted (if `retry`).
+        """
+        if self.process is None: self.restart("not running")
+        if frame is not None: message += self.publish(frame)
+
+        try:
+            self.conn.send(message)
+            kind, payload = self.receive(self.timeout)
+        except (OSError, ValueError) as e:
+            kind, payload = 'error', f"worker exited ({e})"
+
+        if kind != 'error': return payload
+
+        # a tracker exception leaves the worker usable, anything else does not
+        self.stats['failures'] += 1
+        if self.process.is_alive() and not payload.startswith("no reply"):
+            if debug: print(f"[DBG] Tracker process error: {payload}")
+        elif retry:
+            self.restart(payload)
+        else:
+            self.stop_worker()
+        return None
+
+    def apply(self, result):
+        if result is None:
+            self.boundary, self.center = None, None
+            return
+        self.boundary, self.center = result['boundary'], result['center']
+        for name, args, kwargs in result['calls']:
+            getattr(self.interface, name)(*args, **kwargs)
+
+    #
+    # Tracker
+    #
+
+    def set_ring(self, ring):
+        """Read frames the pipeline published to `ring` (a FrameRing) from there instead of copying them."""
+        self.shared_ring = ring
+
+    def request_selection(self, boundary, frame, retry=True):
+        return self.request(('select', boundary), frame, retry)
+
+    def set_object(self):
+        boundary, frame = self.interface.boundary, self.interface.boundary_frame
+        if boundary is None or frame is None: return
+
+        with self.lock:
+            self.selection = (tuple(boundary), frame.copy())
+            self.apply(self.request_selection(*self.selection))
+
+    def on_frame(self, frame):
+        with self.lock:
+            self.apply(self.request(('frame',), frame))
+            self.stats['frames'] += 1
+
+    def call(self, name, *args):
+        """Call a tracker method in the worker and return its (picklable) result."""
+        with self.lock:
+            return self.request(('call', name, args))
+
+    def select_face(self, x, y): return self.call('select_face', x, y)
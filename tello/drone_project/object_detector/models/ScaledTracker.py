@@ -0,0 +1,113 @@
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+import cv2
+from user_interface.util.Overlay import Overlay
+
+# 
+# The "ScaledInterface" class
+# 
+
+class ScaledInterface:
+    """
+    Interface proxy handed to a tracker that runs on downscaled frames.
+    The selected boundary and frame are given to the tracker at its scale,
+    and the boxes / centers it reports are mapped back to full resolution.
+    Everything else is forwarded to the real interface.
+    """
+
+    def __init__(self, scaled):
+        self._scaled = scaled
+
+    @property
+    def boundary(self):
+        return self._scaled.down(self._scaled.interface.boundary)
+
+    @property
+    def boundary_frame(self):
+        frame = self._scaled.interface.boundary_frame
+        return None if frame is None else self._scaled.prepare(frame)
+
+    def update_boundary(self, x, y=None, w=None, h=None, **kwargs):
+        box = tuple(x) if y is None else (x, y, w, h)
+        self._scaled.interface.update_boundary(*self._scaled.up(box), **kwargs)
+
+    def update_center(self, cx, cy=None, **kwargs):
+        center = tuple(cx) if cy is None else (cx, cy)
+        self._scaled.interface.update_center(*self._scaled.up(center), **kwargs)
+
+    def set_layer(self, name, primitives):
+        self._scaled.interface.set_layer(name, Overlay.scale(primitives, 1 / self._scaled.scale))
+
+    def __getattr__(self, name):
+        return getattr(self._scaled.interface, name)
+
+# 
+# The "ScaledTracker" class
+# 
+
+class ScaledTracker:
+    """
+    Runs a tracker on a downscaled (and optionally grayscale) copy of each
+    frame, made once per frame, and exposes its `boundary` / `center` in
+    full-resolution coordinates, so navigation and display are unchanged.
+    Grayscale is only used for trackers with `ACCEPTS_GRAYSCALE`.
+    """
+
+    def __init__(self, model_class, interface, scale=1.0, grayscale=False, **kwargs):
+
+        # Arguments
+        self.interface = interface
+        self.scale = scale
+        self.grayscale = grayscale and getattr(model_class, 'ACCEPTS_GRAYSCALE', False)
+
+        # Tracker, built against the scaled interface
+        self.scaled_interface = ScaledInterface(self)
+        self.tracker = model_class(self.scaled_interface, **kwargs)
+        self.tracker.input_scale = scale
+
+    # 
+    # Coordinates
+    # 
+
+    def prepare(self, frame):
+        if self.scale != 1:
+            frame = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        if self.grayscale and frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+    def up(self, values):
+        if not values: return values
+        return tuple(int(round(v / self.scale)) for v in values)
+
+    def down(self, values):
+        if not values: return values
+        return tuple(int(round(v * self.scale)) for v in values)
+
+    # 
+    # Tracker
+    # 
+
+    @property
+    def boundary(self): return self.up(self.tracker.boundary)
+
+    @property
+    def center(self): return self.up(self.tracker.center)
+
+    def set_object(self):
+        self.tracker.set_object()
+
+    def on_frame(self, frame):
+        self.tracker.on_frame(self.prepare(frame))
+
+    def select_face(self, x, y):
+        x, y = self.down((x, y))
+        detection = self.tracker.select_face(x, y)
+        if detection:
+            detection = dict(detection, box=self.up(detection["box"]), center=self.up(detection["center"]))
+        return detection
+
+    def __getattr__(self, name):
+        if name == 'tracker': raise AttributeError(name)
+        return getattr(self.tracker, name)
@@ -8,6 +8,7 @@ from ultralytics import YOLO
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
 from config.settings import debug
+from user_interface.util.Overlay import Overlay
 from navigation_plan.navigators.GridNavigator import GridNavigator
 
 #
@@ -85,15 +86,14 @@ class YoloV8Tracker:
 
     def draw_center_line(self, frame):
         if self.is_tracking and self.center:
-            # Draw center crosshair
-            h, w, _ = frame.shape
+            # Center crosshair and tracking line, drawn by the interface on the display frame
+            h, w = frame.shape[:2]
             center_x, center_y = w // 2, h // 2
-            cv2.line(frame, (center_x, 0), (center_x, h), (0, 255, 0), 1)
-            cv2.line(frame, (0, center_y), (w, center_y), (0, 255, 0), 1)
-
-            # Draw tracking line from center to detected face
-            if self.center:
-                cv2.line(frame, (center_x, center_y), self.center, (255, 0, 0), 2)
+            self.interface.set_layer('tracker', [
+                Overlay.line((center_x, 0), (center_x, h), (0, 255, 0), 1),
+                Overlay.line((0, center_y), (w, center_y), (0, 255, 0), 1),
+                Overlay.line((center_x, center_y), self.center, (255, 0, 0), 2),
+            ])
 
             self.interface.update_center(*self.center, color=self.point_color)
 
@@ -121,3 +121,4 @@ class YoloV8Tracker:
         self.center = None
         self.interface.hide_boundary()
         self.interface.hide_center()
+        self.interface.set_layer('tracker', [])
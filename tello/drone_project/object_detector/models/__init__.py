@@ -3,4 +3,47 @@
 # from .CV2TrackerMOSSE import CV2TrackerMOSSE
 # from .KalmanFilterTracker import KalmanFilterTracker
 # from .PointCV2TrackerCSRT import PointCV2TrackerCSRT
-# from .PointDaSiamRPNTracker import PointDaSiamRPNTracker
\ No newline at end of file
+# from .PointDaSiamRPNTracker import PointDaSiamRPNTracker
+
+import importlib
+
+# 
+# Model registry
+# 
+# Trackers are imported only when requested, so the heavy dependencies of
+# one tracker (torch, ultralytics, PyQt6, ...) are never loaded for another.
+# 
+
+MODELS = {
+    "CSRTTracker": "CSRTTracker",
+    "DaSiamRPNTracker": "DaSiamRPNTracker",
+    "DaSiamMultipleTracker": "DaSiamMultipleTracker",
+    "YoloV8Tracker": "YoloV8Tracker",
+    "LightCNNTracker": "LightCNNTracker",
+}
+
+def get_model_class(name):
+    if name not in MODELS:
+        raise ImportError(f"Model {name} is not implemented.")
+    module = importlib.import_module(f".{MODELS[name]}", __name__)
+    return getattr(module, name)
+
+def build_model(model_class, interface, scale=None, grayscale=None, **kwargs):
+    """Instantiate a tracker, wrapped in a ScaledTracker when TRACK_SCALE / TRACK_GRAYSCALE ask for it."""
+    from config.settings import TRACK_SCALE, TRACK_GRAYSCALE
+    scale = TRACK_SCALE if scale is None else scale
+    grayscale = TRACK_GRAYSCALE if grayscale is None else grayscale
+
+    if scale == 1 and not grayscale:
+        return model_class(interface, **kwargs)
+
+    from .ScaledTracker import ScaledTracker
+    return ScaledTracker(model_class, interface, scale, grayscale, **kwargs)
+
+def load_model(name, interface, **kwargs):
+    return build_model(get_model_class(name), interface, **kwargs)
+
+def load_model_process(name, interface, **kwargs):
+    """Build tracker `name` (with `load_model`) in a worker process, see ProcessTracker."""
+    from .ProcessTracker import ProcessTracker
+    return ProcessTracker(name, interface, **kwargs)
@@ -56,14 +56,14 @@ class network_9layers(nn.Module):
             nn.MaxPool2d(kernel_size=2, stride=2, ceil_mode=True),
             )
         self.fc1 = mfm(8*8*128, 256, type=0)
-        self.fc2 = nn.Linear(256, num_classes)
+        self.fc2 = nn.Linear(256, num_classes) if num_classes else None
 
     def forward(self, x):
         x = self.features(x)
         x = x.view(x.size(0), -1)
         x = self.fc1(x)
         x = F.dropout(x, training=self.training)
-        out = self.fc2(x)
+        out = self.fc2(x) if self.fc2 is not None else None
         return out, x
 
 class network_29layers(nn.Module):
@@ -83,7 +83,7 @@ class network_29layers(nn.Module):
         self.group4 = group(128, 128, 3, 1, 1)
         self.pool4  = nn.MaxPool2d(kernel_size=2, stride=2, ceil_mode=True)
         self.fc     = mfm(8*8*128, 256, type=0)
-        self.fc2    = nn.Linear(256, num_classes)
+        self.fc2    = nn.Linear(256, num_classes) if num_classes else None
             
     def _make_layer(self, block, num_blocks, in_channels, out_channels):
         layers = []
@@ -112,7 +112,7 @@ class network_29layers(nn.Module):
         x = x.view(x.size(0), -1)
         fc = self.fc(x)
         fc = F.dropout(fc, training=self.training)
-        out = self.fc2(fc)
+        out = self.fc2(fc) if self.fc2 is not None else None
         return out, fc
 
 
@@ -129,7 +129,7 @@ class network_29layers_v2(nn.Module):
         self.block4   = self._make_layer(block, layers[3], 128, 128)
         self.group4   = group(128, 128, 3, 1, 1)
         self.fc       = nn.Linear(8*8*128, 256)
-        self.fc2 = nn.Linear(256, num_classes, bias=False)
+        self.fc2 = nn.Linear(256, num_classes, bias=False) if num_classes else None
             
     def _make_layer(self, block, num_blocks, in_channels, out_channels):
         layers = []
@@ -158,7 +158,7 @@ class network_29layers_v2(nn.Module):
         x = x.view(x.size(0), -1)
         fc = self.fc(x)
         x = F.dropout(fc, training=self.training)
-        out = self.fc2(x)
+        out = self.fc2(x) if self.fc2 is not None else None
         return out, fc
 
 def LightCNN_9Layers(**kwargs):
@@ -171,4 +171,37 @@ def LightCNN_29Layers(**kwargs):
 
 def LightCNN_29Layers_v2(**kwargs):
     model = network_29layers_v2(resblock, [1, 2, 3, 4], **kwargs)
-    return model
\ No newline at end of file
+    return model
+
+ARCHITECTURES = {
+    'LightCNN-9': LightCNN_9Layers,
+    'LightCNN-29': LightCNN_29Layers,
+    'LightCNN-29v2': LightCNN_29Layers_v2,
+}
+
+def embedding_state_dict(state_dict):
+    """Strip the DataParallel prefix and drop the fc2 classifier weights."""
+    state_dict = {k.replace('module.', ''): v for k, v in state_dict.items()}
+    return {k: v for k, v in state_dict.items() if not k.startswith('fc2.')}
+
+def load_embedding_model(checkpoint_path, arch='LightCNN-29', device='cpu'):
+    """
+    Build an embedding-only model (no fc2 head) and load the matching
+    weights from a full training checkpoint or a slimmed one.
+    forward() returns (None, features).
+    """
+    if arch not in ARCHITECTURES:
+        raise ValueError(f"Invalid model type: {arch}")
+
+    model = ARCHITECTURES[arch](num_classes=None)
+    checkpoint = torch.load(checkpoint_path, map_location=torch.device(device))
+    state_dict = checkpoint.get('state_dict', checkpoint)
+    model.load_state_dict(embedding_state_dict(state_dict))
+    model.eval()
+    return model
+
+def save_embedding_checkpoint(checkpoint_path, save_path):
+    """Write a checkpoint without the classifier head, for faster loading."""
+    checkpoint = torch.load(checkpoint_path, map_location=torch.device('cpu'))
+    state_dict = embedding_state_dict(checkpoint.get('state_dict', checkpoint))
+    torch.save({'state_dict': state_dict}, save_path)
@@ -0,0 +1,95 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import argparse
+import time
+import cv2
+import numpy as np
+from object_detector.detectors.FaceDetector import get_face_detector
+
+# 
+# Arguments
+# 
+
+parser = argparse.ArgumentParser(description='Benchmark the face detector backends on a set of images.')
+parser.add_argument('images', type=str, help='Image file or directory of images')
+parser.add_argument('--backends', default='haar,dnn', type=str, help='Comma separated backends')
+parser.add_argument('--scales', default='1.0,0.5', type=str, help='Comma separated haar detection scales')
+parser.add_argument('--repeat', default=5, type=int, help='Runs per image')
+parser.add_argument('--size', default='960x720', type=str, help='Resize images to WxH before detection (0 to keep)')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+# 
+# Helpers
+# 
+
+def load_images(path, size):
+    files = [path] if os.path.isfile(path) else sorted(
+        os.path.join(root, f) for root, _, names in os.walk(path) for f in names if f.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+    images = []
+    for file in files:
+        image = cv2.imread(file)
+        if image is None: continue
+        if size: image = cv2.resize(image, size)
+        images.append(image)
+
+    return images
+
+def benchmark(detector, images, repeat):
+    detector.detect(images[0]) # warm-up
+
+    timings, faces = [], 0
+    for image in images:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            boxes = detector.detect(image)
+            timings.append((time.perf_counter() - start) * 1000)
+        faces += len(boxes)
+
+    timings = np.array(timings)
+    return {
+        'mean': timings.mean(),
+        'p50': np.percentile(timings, 50),
+        'p95': np.percentile(timings, 95),
+        'fps': 1000 / timings.mean(),
+        'faces': faces,
+    }
+
+# 
+# Main
+# 
+
+def main():
+    args = parser.parse_args()
+    size = None if args.size == '0' else tuple(int(v) for v in args.size.split('x'))
+
+    images = load_images(args.images, size)
+    if not images:
+        raise FileNotFoundError(f"No images found at '{args.images}'")
+    print(f"Benchmarking on {len(images)} images x {args.repeat} runs")
+
+    configs = []
+    for backend in args.backends.split(','):
+        if backend == 'haar':
+            configs += [(f"haar@{scale}", backend, {'scale': float(scale)}) for scale in args.scales.split(',')]
+        else:
+            configs.append((backend, backend, {}))
+
+    print(f"{'backend':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'fps':>8}{'faces':>8}")
+    for label, backend, kwargs in configs:
+        try:
+            detector = get_face_detector(backend, **kwargs)
+        except Exception as e:
+            print(f"{label:<12} unavailable: {e}")
+            continue
+
+        r = benchmark(detector, images, args.repeat)
+        print(f"{label:<12}{r['mean']:>10.2f}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['fps']:>8.1f}{r['faces']:>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import argparse
+import json
+import platform
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+import cv2
+import numpy as np
+
+#
+# Arguments
+#
+
+parser = argparse.ArgumentParser(description='Benchmark the trackers on annotated sequences.')
+parser.add_argument('sequences', nargs='+', type=str, help='Sequence directories (images/ + labels/ in YOLO format, or images + groundtruth.txt)')
+parser.add_argument('--models', default='CSRTTracker,DaSiamRPNTracker,DaSiamMultipleTracker,YoloV8Tracker,LightCNNTracker', type=str, help='Comma separated tracker names')
+parser.add_argument('--max-frames', default=None, type=int, help='Frames per sequence, from the first annotated frame')
+parser.add_argument('--output', default=os.path.join('data', 'benchmarks'), type=str, help='Directory for the JSON results')
+parser.add_argument('--compare', default=None, type=str, help='Previous results JSON to compare against')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+SUCCESS_IOU = 0.5
+
+#
+# Sequences
+#
+
+def load_sequence(path):
+    """
+    Return (images_dir, ground_truth) where ground_truth[i] is the (x, y, w, h)
+    box of the i-th image or None. Supports `images/` + `labels/` with YOLO
+    labels (class cx cy w h, normalised) and an OTB style `groundtruth.txt`.
+    """
+    images_dir = os.path.join(path, 'images') if os.path.isdir(os.path.join(path, 'images')) else path
+    images = sorted(f for f in os.listdir(images_dir) if f.lower().endswith(IMAGE_EXTENSIONS))
+
+    groundtruth_file = os.path.join(path, 'groundtruth.txt')
+    if os.path.isfile(groundtruth_file):
+        with open(groundtruth_file) as f:
+            boxes = [tuple(int(float(v)) for v in line.replace('\t', ',').split(',')[:4]) if line.strip() else None for line in f]
+        return images_dir, (boxes + [None] * len(images))[:len(images)]
+
+    labels_dir = os.path.join(path, 'labels')
+    boxes = []
+    for image in images:
+        label = os.path.join(labels_dir, os.path.splitext(image)[0] + '.txt')
+        box = None
+        if os.path.isfile(label):
+            with open(label) as f:
+                lines = [l.split() for l in f if l.strip()]
+            if lines:
+                height, width = cv2.imread(os.path.join(images_dir, image)).shape[:2]
+                _, cx, cy, w, h = (float(v) for v in lines[0][:5])
+                box = (int((cx - w / 2) * width), int((cy - h / 2) * height), int(w * width), int(h * height))
+        boxes.append(box)
+
+    return images_dir, boxes
+
+#
+# Metrics
+#
+
+def iou(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    iw = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    ih = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = iw * ih
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+def peak_rss_mb():
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / 2**20 if sys.platform == 'darwin' else rss / 2**10
+    except ImportError:
+        return None
+
+def run_one(model, sequence, max_frames):
+    """
+    Benchmark one tracker on one sequence (runs in its own process for clean
+    memory peaks). Memory is the process peak RSS, so nothing traces the
+    allocations of the timed loop.
+    """
+    from core.HeadlessRunner import HeadlessRunner
+    from object_detector.input.FileCam import FileCam
+
+    images_dir, ground_truth = load_sequence(sequence)
+    first = next((i for i, box in enumerate(ground_truth) if box), None)
+    if first is None:
+        return {'model': model, 'sequence': sequence, 'error': 'no ground truth'}
+
+    try:
+        runner = HeadlessRunner(FileCam(images_dir), model, ground_truth[first], first)
+    except Exception as e:
+        return {'model': model, 'sequence': sequence, 'error': f"{type(e).__name__}: {e}"}
+
+    latencies, ious, losses, was_tracking = [], [], 0, False
+    start = time.perf_counter()
+    for record in runner.run(first + max_frames if max_frames else None):
+        i = record['frame']
+        if i < first: continue
+        latencies.append(record['model_ms'])
+
+        box = None if record['x'] is None else (record['x'], record['y'], record['w'], record['h'])
+        if was_tracking and box is None: losses += 1
+        was_tracking = box is not None
+
+        if ground_truth[i]: ious.append(iou(box, ground_truth[i]) if box else 0.0)
+    elapsed = time.perf_counter() - start
+
+    latencies, ious = np.array(latencies), np.array(ious)
+    thresholds = np.linspace(0, 1, 21)
+    return {
+        'model': model,
+        'sequence': sequence,
+        'frames': int(len(latencies)),
+        'fps': len(latencies) / elapsed if elapsed else None,
+        'latency_ms': {q: float(np.percentile(latencies, int(q[1:]))) for q in ('p50', 'p95', 'p99')} if len(latencies) else None,
+        'mean_iou': float(ious.mean()) if len(ious) else None,
+        'success_rate': float((ious >= SUCCESS_IOU).mean()) if len(ious) else None,
+        'success_auc': float(np.mean([(ious >= t).mean() for t in thresholds])) if len(ious) else None,
+        'losses': losses,
+        'losses_per_100_frames': 100 * losses / max(len(latencies), 1),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+#
+# Reporting
+#
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(__file__), text=True).strip()
+    except Exception:
+        return None
+
+def fmt(value, spec):
+    return format(value, spec) if isinstance(value, (int, float)) else format('-', spec.split('.')[0] + 's')
+
+def print_table(results, previous=None):
+    previous = {(r['model'], r['sequence']): r for r in (previous or [])}
+    print(f"{'model':<24}{'sequence':<24}{'fps':>8}{'p50 ms':>9}{'p95 ms':>9}{'IoU':>7}{'succ':>7}{'loss/100':>9}{'RSS MB':>9}  trend")
+    for r in results:
+        if 'error' in r:
+            print(f"{r['model']:<24}{os.path.basename(r['sequence'].rstrip('/')):<24} error: {r['error']}")
+            continue
+
+        trend = ''
+        old = previous.get((r['model'], r['sequence']))
+        if old and 'error' not in old and old.get('fps') and r['fps']:
+            trend = f"fps {100 * (r['fps'] / old['fps'] - 1):+.0f}%"
+            if old.get('success_rate') is not None and r['success_rate'] is not None:
+                trend += f", succ {r['success_rate'] - old['success_rate']:+.3f}"
+
+        latency = r['latency_ms'] or {}
+        print(f"{r['model']:<24}{os.path.basename(r['sequence'].rstrip('/')):<24}"
+              f"{fmt(r['fps'], '>8.1f')}{fmt(latency.get('p50'), '>9.1f')}{fmt(latency.get('p95'), '>9.1f')}"
+              f"{fmt(r['mean_iou'], '>7.3f')}{fmt(r['success_rate'], '>7.3f')}{fmt(r['losses_per_100_frames'], '>9.2f')}"
+              f"{fmt(r['peak_rss_mb'], '>9.0f')}  {trend}")
+
+#
+# Main
+#
+
+def main():
+    args = parser.parse_args()
+
+    results = []
+    for model in args.models.split(','):
+        for sequence in args.sequences:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    results.append(pool.submit(run_one, model, sequence, args.max_frames).result())
+                except Exception as e:
+                    results.append({'model': model, 'sequence': sequence, 'error': f"{type(e).__name__}: {e}"})
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['results']
+    print_table(results, previous)
+
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, time.strftime('trackers-%Y%m%d-%H%M%S.json'))
+    with open(path, 'w') as f:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': git_commit(),
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'results': results,
+        }, f, indent=2)
+    print(f"Results saved to {path}")
+
+if __name__ == '__main__':
+    main()
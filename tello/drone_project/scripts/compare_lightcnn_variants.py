@@ -0,0 +1,115 @@
+# 
+# Imports
+# 
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import argparse
+import time
+import cv2
+import numpy as np
+import torch
+from object_detector.models.light_cnn import ARCHITECTURES, load_embedding_model, save_embedding_checkpoint
+from object_detector.detectors.FaceDetector import get_face_detector
+
+# 
+# Arguments
+# 
+
+parser = argparse.ArgumentParser(description='Compare the full LightCNN model against the embedding-only variants on the gallery.')
+parser.add_argument('--root_path', default=os.path.join('data', 'dataset'), type=str, help='Gallery root: one folder of face images per person')
+parser.add_argument('--checkpoint', default=os.path.join('object_detector', 'LightCNN_29Layers_checkpoint.pth'), type=str, help='LightCNN-29 checkpoint')
+parser.add_argument('--checkpoint_9', default=None, type=str, help='Optional LightCNN-9 checkpoint')
+parser.add_argument('--num_classes', default=79077, type=int, help='Classifier size of the full checkpoint')
+parser.add_argument('--save_slim', default=None, type=str, help='Also write the slimmed LightCNN-29 checkpoint to this path')
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+# 
+# Helpers
+# 
+
+def load_gallery(root_path):
+    """Return (faces, labels) with one 128x128 grayscale crop per image."""
+    detector = get_face_detector()
+    faces, labels = [], []
+
+    for person in sorted(os.listdir(root_path)):
+        person_path = os.path.join(root_path, person)
+        if not os.path.isdir(person_path): continue
+
+        for name in sorted(os.listdir(person_path)):
+            if not name.lower().endswith(IMAGE_EXTENSIONS): continue
+            img = cv2.imread(os.path.join(person_path, name), cv2.IMREAD_GRAYSCALE)
+            if img is None: continue
+
+            boxes = detector.detect(img)
+            if not len(boxes): continue
+
+            x, y, w, h = max(boxes, key=lambda b: b[2] * b[3])
+            faces.append(cv2.resize(img[y:y+h, x:x+w], (128, 128)))
+            labels.append(person)
+
+    return faces, labels
+
+def embed(model, faces):
+    batch = torch.from_numpy(np.stack(faces)).float().div_(255).unsqueeze(1)
+    timings, features = [], []
+    with torch.no_grad():
+        for i in range(len(faces)):
+            start = time.perf_counter()
+            _, f = model(batch[i:i+1])
+            timings.append((time.perf_counter() - start) * 1000)
+            features.append(f.numpy()[0])
+    return np.array(features), np.array(timings)
+
+def rank1_accuracy(features, labels):
+    """Leave-one-out nearest neighbour accuracy with cosine similarity."""
+    normed = features / np.linalg.norm(features, axis=1, keepdims=True)
+    similarity = normed @ normed.T
+    np.fill_diagonal(similarity, -np.inf)
+    nearest = similarity.argmax(axis=1)
+    labels = np.array(labels)
+    return float((labels[nearest] == labels).mean())
+
+def parameter_mb(model):
+    return sum(p.numel() * p.element_size() for p in model.parameters()) / 2**20
+
+# 
+# Main
+# 
+
+def main():
+    args = parser.parse_args()
+
+    faces, labels = load_gallery(args.root_path)
+    if len(set(labels)) < 2:
+        raise ValueError(f"Need faces of at least two people in '{args.root_path}', found {len(faces)} faces")
+    print(f"Gallery: {len(faces)} faces of {len(set(labels))} people")
+
+    # full model, as the tracker used to load it
+    full = ARCHITECTURES['LightCNN-29'](num_classes=args.num_classes)
+    checkpoint = torch.load(args.checkpoint, map_location=torch.device('cpu'))
+    full.load_state_dict({k.replace('module.', ''): v for k, v in checkpoint['state_dict'].items()})
+    full.eval()
+
+    variants = [
+        ('LightCNN-29 full', full),
+        ('LightCNN-29 slim', load_embedding_model(args.checkpoint, 'LightCNN-29')),
+    ]
+    if args.checkpoint_9:
+        variants.append(('LightCNN-9 slim', load_embedding_model(args.checkpoint_9, 'LightCNN-9')))
+
+    reference = None
+    print(f"{'variant':<20}{'params MB':>10}{'mean ms':>10}{'p95 ms':>10}{'rank-1':>8}{'max diff':>10}")
+    for label, model in variants:
+        features, timings = embed(model, faces)
+        if reference is None: reference = features
+        diff = np.abs(features - reference).max() if features.shape == reference.shape else float('nan')
+        print(f"{label:<20}{parameter_mb(model):>10.1f}{timings.mean():>10.2f}{np.percentile(timings, 95):>10.2f}{rank1_accuracy(features, labels):>8.3f}{diff:>10.2e}")
+
+    if args.save_slim:
+        save_embedding_checkpoint(args.checkpoint, args.save_slim)
+        print(f"Saved slim checkpoint to '{args.save_slim}'")
+
+if __name__ == '__main__':
+    main()
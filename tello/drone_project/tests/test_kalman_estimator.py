@@ -0,0 +1,26 @@
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import pytest
+
+pytest.importorskip("numpy")
+from navigation_plan.estimators.KalmanEstimator import KalmanEstimator
+
+def test_miss_before_update_keeps_the_filter_empty():
+    estimator = KalmanEstimator()
+    estimator.miss(1.0)
+
+    assert not estimator.initialized
+    assert estimator.predict(1.0) is None
+
+def test_miss_after_update_coasts_then_resets():
+    estimator = KalmanEstimator(max_coast=0.5)
+    estimator.update((100, 100), (80, 80, 40, 40), 1.0)
+
+    estimator.miss(1.1)
+    assert estimator.initialized
+    assert estimator.has_size
+    assert estimator.predict(1.1) is not None
+
+    # past max_coast without a detection the target is lost
+    estimator.miss(1.7)
+    assert not estimator.initialized
+    assert estimator.predict(1.7) is None
@@ -2,6 +2,7 @@ import cv2
 import os, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from config.settings import debug
+from user_interface.util.Overlay import Overlay
 
 # 
 # The "CV2Interface" class
@@ -33,6 +34,7 @@ class CV2Interface:
 
         # Variables
         self.camera = None
+        self.pipeline = None
         self.ix, self.iy = -1, -1
         self.boundary = None
         self.boundary_color = self.COLORS['green']
@@ -44,26 +46,33 @@ class CV2Interface:
         self.on_boundary_listeners = []
         self.on_frame_listeners = []
 
+        # Overlay layers drawn on the displayed frame
+        self.overlay = Overlay()
+
     # 
     # Core
     # 
 
     def set_camera(self, camera): self.camera = camera
+    def set_pipeline(self, pipeline): self.pipeline = pipeline
     def update_image(self, frame): cv2.imshow(self.window_label, frame)
 
     def add_on_boundary   (self, callback): self.on_boundary_listeners.append(callback)
     def add_frame_listener(self, callback): self.on_frame_listeners.append(callback)
+    def set_layer(self, name, primitives): self.overlay.set_layer(name, primitives)
 
     # Input Boundary
     def input_boundary(self):
-        self.boundary_frame = self.camera.frame()
+        self.boundary_frame = self.pipeline.latest_frame() if self.pipeline else self.camera.frame()
+        if self.boundary_frame is None: return
+        self.boundary_frame = self.boundary_frame.copy()
 
         cv2.namedWindow(self.window_label)
         cv2.setMouseCallback(self.window_label, self.input_boundary_callback)
 
         while True:
             frame = self.boundary_frame.copy()
-            self.draw_boundary(frame, force=True)
+            Overlay.draw(frame, self.boundary_primitives(force=True))
             self.update_image(frame)
 
             key = cv2.waitKey(1) & 0xFF
@@ -93,7 +102,10 @@ class CV2Interface:
     def confirm_boundary(self):
         if self.boundary and self.is_drawing_boundary:
             for callback in self.on_boundary_listeners:
-                callback()
+                if self.pipeline:
+                    with self.pipeline.inference_lock: callback()
+                else:
+                    callback()
         self.is_drawing_boundary = False
     
     # Cancel Boundary
@@ -120,20 +132,24 @@ class CV2Interface:
     def show_center(self): self.is_center_hidden = False
     def hide_center(self): self.is_center_hidden = True
 
-    def draw_boundary(self, frame, force=False):
-        if frame is not None and self.boundary and (force or not self.is_boundary_hidden):
-            x, y, w, h = self.boundary
-            cv2.rectangle(frame, (x, y), (x + w, y + h), self.boundary_color, 2)
+    def boundary_primitives(self, force=False):
+        if not self.boundary or not (force or not self.is_boundary_hidden): return []
+        x, y, w, h = self.boundary
+        return [Overlay.rect((x, y), (x + w, y + h), self.boundary_color, 2)]
 
-    def draw_center(self, frame, force=False):
-        if frame is not None and self.center and (force or not self.is_center_hidden):
-            frame_center = (frame.shape[1] // 2, frame.shape[0] // 2)
-            cv2.line(frame, frame_center, self.center, self.center_color, 2)
-            cv2.circle(frame, self.center, radius=5, color=self.center_color, thickness=-1)
+    def center_primitives(self, frame_size, force=False):
+        if not self.center or not (force or not self.is_center_hidden): return []
+        frame_center = (frame_size[0] // 2, frame_size[1] // 2)
+        return [
+            Overlay.line(frame_center, self.center, self.center_color, 2),
+            Overlay.circle(self.center, 5, self.center_color),
+        ]
 
     def draw(self, frame):
-        self.draw_boundary(frame)
-        self.draw_center(frame)
+        """Draw all overlay layers on `frame` (the display copy)."""
+        height, width = frame.shape[:2]
+        self.overlay.set_layer('interface', self.boundary_primitives() + self.center_primitives((width, height)))
+        self.overlay.render(frame)
 
     # 
     # Close
@@ -143,6 +159,7 @@ class CV2Interface:
         if debug: print("[DBG] Closing CV2Interface.")
 
         self.is_closed = True
+        if self.pipeline: self.pipeline.stop()
         self.camera.stop()
         cv2.destroyAllWindows()
 
@@ -158,9 +175,15 @@ class CV2Interface:
             return
 
         # Camera Frame
-        frame = self.camera.frame()
+        if self.pipeline:
+            frame = self.pipeline.render()
+            if frame is None: return
+        else:
+            frame = self.camera.frame()
+            if frame is None: return
+            for callback in self.on_frame_listeners: callback(frame)
+            frame = frame.copy() # draw on a copy, the camera may hand the same buffer to the tracker again
 
-        for callback in self.on_frame_listeners: callback(frame)
         self.draw(frame)
 
         self.update_image(frame)
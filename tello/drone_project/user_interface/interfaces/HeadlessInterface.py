@@ -0,0 +1,93 @@
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from user_interface.util.Overlay import Overlay
+
+# 
+# The "HeadlessInterface" class
+# 
+
+class HeadlessInterface:
+    """
+    Interface without a window, for offline runs and benchmarks.
+    It keeps the same state and callbacks the trackers use (boundary,
+    boundary_frame, update/show/hide) and lets the caller select the
+    target programmatically with `select_boundary`.
+    """
+
+    # 
+    # Constructor
+    # 
+
+    def __init__(self):
+
+        # States
+        self.is_closed = False
+        self.is_drawing_boundary = False
+        self.is_boundary_hidden = True
+        self.is_center_hidden = True
+
+        # Variables
+        self.camera = None
+        self.pipeline = None
+        self.boundary = None
+        self.boundary_frame = None
+        self.center = None
+
+        # Listeners
+        self.on_boundary_listeners = []
+        self.on_frame_listeners = []
+
+        # Overlay layers (kept, never rendered)
+        self.overlay = Overlay()
+
+    # 
+    # Core
+    # 
+
+    def set_camera(self, camera): self.camera = camera
+    def set_pipeline(self, pipeline): self.pipeline = pipeline
+
+    def add_on_boundary   (self, callback): self.on_boundary_listeners.append(callback)
+    def add_frame_listener(self, callback): self.on_frame_listeners.append(callback)
+    def set_layer(self, name, primitives): self.overlay.set_layer(name, primitives)
+
+    def select_boundary(self, boundary, frame):
+        """Select a target (x, y, w, h) on `frame` and notify the boundary listeners."""
+        self.boundary = tuple(int(v) for v in boundary)
+        self.boundary_frame = frame
+        for callback in self.on_boundary_listeners: callback()
+
+    # 
+    # Boundary and Center methods
+    # 
+
+    def update_boundary(self, x, y=None, w=None, h=None, color=None, show=False):
+        self.boundary = tuple(x) if y is None else (x, y, w, h)
+        if show: self.show_boundary()
+
+    def update_center(self, cx, cy=None, color=None, show=False):
+        self.center = tuple(cx) if cy is None else (cx, cy)
+        if show: self.show_center()
+
+    def show_boundary(self): self.is_boundary_hidden = False
+    def hide_boundary(self): self.is_boundary_hidden = True
+    def show_center(self): self.is_center_hidden = False
+    def hide_center(self): self.is_center_hidden = True
+
+    # 
+    # Loop
+    # 
+
+    def loop(self):
+        if self.is_closed: return
+
+        frame = self.camera.frame()
+        if frame is None:
+            self.close()
+            return
+
+        for callback in self.on_frame_listeners: callback(frame)
+
+    def close(self):
+        self.is_closed = True
+        if self.pipeline: self.pipeline.stop()
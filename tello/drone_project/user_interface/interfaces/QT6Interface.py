@@ -6,31 +6,18 @@ from PyQt6.QtWidgets import (
     QApplication, QLabel, QWidget, QVBoxLayout, QPushButton,
     QHBoxLayout, QGridLayout
 )
-from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtCore import QTimer, Qt, QRect, pyqtSignal
 from PyQt6.QtSvgWidgets import QSvgWidget
 
-# Attempt to load the YOLO model. If unavailable, suppress the error.
-try:
-    from ultralytics import YOLO
-    MODEL_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'local', 'YoloV8Tracker_model.pt')
-    yolo_model = YOLO(MODEL_PATH)
-    print("YOLO model loaded successfully.")
-except Exception as e:
-    print(f"[INFO] YOLO model not loaded or not required: {e}")
-    yolo_model = None
-
 import cv2
 import numpy as np
-from config.settings import debug, FRAME_SIZE, MAX_DISTANCE, FRAME_RATE
+from config.settings import debug, FRAME_RATE
+from user_interface.util.Overlay import Overlay
+from user_interface.util.QtWorkers import PipelineBridge
 
-# Global key constants and maximum distances for each axis
+# Global key constants
 K = Qt.Key
-max_distances = {
-    'x': FRAME_SIZE[0] // 2,
-    'y': FRAME_SIZE[1] // 2,
-    'z': MAX_DISTANCE
-}
 
 # Helper class for creating UI elements
 class QT6Elements:
@@ -40,18 +27,70 @@ class QT6Elements:
         button.clicked.connect(lambda: callback(label))
         return button
 
-# Custom QLabel that emits a clicked signal with x and y coordinates
-class ClickableLabel(QLabel):
-    clicked = pyqtSignal(int, int)  # Emits (x, y) coordinates
+# Frame display widget: paints a persistent QImage buffer at the widget's size
+class FrameView(QWidget):
+    """
+    Displays frames without per-frame QImage / QPixmap allocations:
+    frames are written into a persistent numpy buffer wrapped by a QImage
+    (`buffer_for` lets the producer render straight into it), and
+    `paintEvent` draws it scaled to the widget, keeping the aspect ratio.
+    Clicks are emitted in frame coordinates.
+    """
+
+    clicked = pyqtSignal(int, int)  # Emits (x, y) in frame coordinates
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = None
+        self.image = None
+        self.target = QRect()
+        self.setMinimumSize(320, 240)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def buffer_for(self, shape):
+        """Return the display buffer for frames of `shape`, reallocating it only when the shape changes."""
+        if self.buffer is None or self.buffer.shape != shape:
+            self.buffer = np.zeros(shape, dtype=np.uint8)
+            height, width = shape[:2]
+            if len(shape) == 2: self.image = QImage(self.buffer.data, width, height, width, QImage.Format.Format_Grayscale8)
+            else:               self.image = QImage(self.buffer.data, width, height, width * 3, QImage.Format.Format_BGR888)
+        return self.buffer
+
+    def show_frame(self, frame=None):
+        """Copy `frame` into the buffer (skipped if it was rendered there) and schedule a repaint."""
+        if frame is not None and frame is not self.buffer:
+            np.copyto(self.buffer_for(frame.shape), frame)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        if self.image is not None:
+            # fit, keeping the aspect ratio
+            scale = min(self.width() / self.image.width(), self.height() / self.image.height())
+            width, height = int(self.image.width() * scale), int(self.image.height() * scale)
+            self.target = QRect((self.width() - width) // 2, (self.height() - height) // 2, width, height)
+            painter.drawImage(self.target, self.image)
+        painter.end()
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            pos = event.position()  # Returns a QPointF
-            self.clicked.emit(int(pos.x()), int(pos.y()))
+        if event.button() == Qt.MouseButton.LeftButton and self.image is not None and self.target.width():
+            pos = event.position()
+            x = (pos.x() - self.target.x()) * self.image.width() / self.target.width()
+            y = (pos.y() - self.target.y()) * self.image.height() / self.target.height()
+            if 0 <= x < self.image.width() and 0 <= y < self.image.height():
+                self.clicked.emit(int(x), int(y))
         super().mousePressEvent(event)
 
 # Main interface class using QWidget
 class QT6Interface(QWidget):
+
+    COLORS = {
+        'blue': (255, 0, 0),
+        'green': (0, 255, 0),
+        'red': (0, 0, 255),
+    }
+
     def __init__(self, controller, frame_rate=FRAME_RATE):
         super().__init__()
 
@@ -71,14 +110,21 @@ class QT6Interface(QWidget):
         self.is_boundary_hidden = True
         self.is_center_hidden = True
 
-        # Camera and tracker references
+        # Overlay layers drawn on the displayed frame
+        self.overlay = Overlay()
+
+        # Camera, pipeline and tracker references
         self.camera = None
+        self.pipeline = None
+        self.bridge = None
         self.tracker = None
 
         # Application state attributes (missing before)
         self.is_closed = False
         self.is_drawing = False
         self.is_drawing_boundary = False
+        self.displayed_seq = 0
+        self.tracked_seq = 0
 
         # Setup UI
         self.setLayout(self.make_layout())
@@ -106,11 +152,10 @@ class QT6Interface(QWidget):
 
     def get_image_sublayout(self):
         """Create a layout for the image display."""
-        self.image_label = ClickableLabel(self)
-        self.image_label.setPixmap(QPixmap())
-        self.image_label.clicked.connect(self.handle_image_click)
+        self.image_view = FrameView(self)
+        self.image_view.clicked.connect(self.handle_image_click)
         layout = QVBoxLayout()
-        layout.addWidget(self.image_label)
+        layout.addWidget(self.image_view)
         return layout
 
     def get_controls_sublayout(self):
@@ -164,6 +209,33 @@ class QT6Interface(QWidget):
         """Assign a camera instance."""
         self.camera = camera
 
+    def set_pipeline(self, pipeline):
+        """
+        Render frames from a FramePipeline instead of processing them on the GUI thread.
+        The polling timer is replaced by the pipeline's signals (see PipelineBridge).
+        """
+        self.pipeline = pipeline
+        self.bridge = PipelineBridge(pipeline, self)
+        self.bridge.frameCaptured.connect(self.on_frame_captured)
+        self.bridge.frameTracked.connect(self.on_frame_tracked)
+        self.stop_loop()
+
+    def on_frame_captured(self, seq):
+        """Slot: the pipeline captured frame `seq`; display the newest frame."""
+        self.bridge.done("capture")
+        self.loop()
+
+    def on_frame_tracked(self, seq, stamps):
+        """Slot: the control stage is done with frame `seq`."""
+        self.bridge.done("control")
+        self.tracked_seq = seq
+        if debug and 'control' in stamps:
+            self.update_status(f"Frame {seq}: {(stamps['control'] - stamps['capture']) * 1000:.0f} ms capture->control")
+
+    def on_loop_failed(self, error):
+        """Slot: the guide / control loop (LoopWorker) raised `error`."""
+        self.update_status(f"Control loop failed: {error}")
+
     def add_on_boundary(self, callback):
         """Register a callback for boundary events."""
         self.on_boundary_listeners.append(callback)
@@ -172,22 +244,45 @@ class QT6Interface(QWidget):
         """Register a callback for frame updates."""
         self.on_frame_listeners.append(callback)
 
+    def set_layer(self, name, primitives):
+        """Replace an overlay layer (see Overlay); safe to call from any thread."""
+        self.overlay.set_layer(name, primitives)
+
     def update_image(self, frame):
-        """Convert and display the current frame on the image label."""
-        height, width, _ = frame.shape
-        q_img = QImage(frame.data, width, height, width * 3, QImage.Format.Format_BGR888)
-        pixmap = QPixmap.fromImage(q_img)
-        self.image_label.setPixmap(pixmap)
-
-    def update_boundary(self, boundary):
-        """Slot: update the displayed boundary overlay."""
-        self.boundary = boundary
-        print(f"UI: Boundary updated to {boundary}")
-
-    def update_center(self, center):
-        """Slot: update the displayed center overlay."""
-        self.center = center
-        print(f"UI: Center updated to {center}")
+        """Display the current frame (painted by the image view on its next paint event)."""
+        self.image_view.show_frame(frame)
+
+    def update_boundary(self, x, y=None, w=None, h=None, color=None, show=False):
+        """Slot: update the displayed boundary overlay, from a (x, y, w, h) tuple or values."""
+        self.boundary = tuple(x) if y is None else (x, y, w, h)
+        if color: self.boundary_color = color
+        if show: self.show_boundary()
+        if debug: print(f"UI: Boundary updated to {self.boundary}")
+
+    def update_center(self, cx, cy=None, color=None, show=False):
+        """Slot: update the displayed center overlay, from a (x, y) tuple or values."""
+        self.center = tuple(cx) if cy is None else (cx, cy)
+        if color: self.center_color = color
+        if show: self.show_center()
+        if debug: print(f"UI: Center updated to {self.center}")
+
+    def show_boundary(self): self.is_boundary_hidden = False
+    def hide_boundary(self): self.is_boundary_hidden = True
+    def show_center(self): self.is_center_hidden = False
+    def hide_center(self): self.is_center_hidden = True
+
+    def draw(self, frame):
+        """Draw all overlay layers on `frame` (the display copy)."""
+        primitives = []
+        if self.boundary and not self.is_boundary_hidden:
+            x, y, w, h = self.boundary
+            primitives.append(Overlay.rect((x, y), (x + w, y + h), self.COLORS[self.boundary_color], 2))
+        if self.center and not self.is_center_hidden:
+            frame_center = (frame.shape[1] // 2, frame.shape[0] // 2)
+            primitives.append(Overlay.line(frame_center, self.center, self.COLORS[self.center_color], 2))
+            primitives.append(Overlay.circle(self.center, 5, self.COLORS[self.center_color]))
+        self.overlay.set_layer('interface', primitives)
+        self.overlay.render(frame)
 
     def handle_tracking_lost(self):
         """Slot: clear overlays when tracking is lost."""
@@ -233,12 +328,27 @@ class QT6Interface(QWidget):
         """Close the application."""
         print("Closing Application")
         self.is_closed = True
+        if self.pipeline:
+            self.pipeline.stop()
 
     def loop(self):
         """Main UI loop: capture a frame, process it, and update the display."""
         if self.is_closed:
             return
 
+        # Threaded pipeline: only render the newest frame here, straight into the display buffer
+        if self.pipeline:
+            seq = self.pipeline.latest_seq()
+            if seq == self.displayed_seq: return
+            self.displayed_seq = seq
+
+            buffer = self.image_view.buffer
+            current_frame = self.pipeline.render(out=buffer)
+            if current_frame is not None:
+                self.draw(current_frame)
+                self.update_image(current_frame)
+            return
+
         current_frame = self.camera.frame()
         if current_frame is None:
             print("[WARN] Camera frame is None, skipping update.")
@@ -250,4 +360,8 @@ class QT6Interface(QWidget):
             if processed_frame is not None:
                 current_frame = processed_frame
 
-        self.update_image(current_frame)
+        # draw on the display buffer, the camera may hand the same frame to the tracker again
+        buffer = self.image_view.buffer_for(current_frame.shape)
+        np.copyto(buffer, current_frame)
+        self.draw(buffer)
+        self.update_image(buffer)
@@ -0,0 +1,102 @@
+import cv2
+import threading
+
+# 
+# The "Overlay" class
+# 
+
+class Overlay:
+    """
+    Layered overlay for the display frame.
+
+    Each producer (interface, tracker, guide) owns a named layer and replaces
+    its whole list of draw primitives with `set_layer`; the swap is a single
+    reference assignment, so producers in other threads never leave a
+    half-written layer. `render` draws every layer once, in `order`, in
+    place on the frame about to be displayed – never on a frame a tracker
+    still reads.
+
+    Primitives are tuples built with the static helpers (`line`, `rect`,
+    `circle`, `text`, `tint`), in the coordinates of the displayed frame.
+    """
+
+    def __init__(self):
+        self.layers = {}
+        self.order = {}
+        self.lock = threading.Lock() # only guards adding / removing layers
+
+    # 
+    # Layers
+    # 
+
+    def set_layer(self, name, primitives, order=None):
+        if name not in self.layers or order is not None:
+            with self.lock:
+                self.order[name] = order if order is not None else self.order.get(name, len(self.order))
+        self.layers[name] = tuple(primitives)
+
+    def clear_layer(self, name):
+        self.layers[name] = ()
+
+    def render(self, frame):
+        with self.lock:
+            names = sorted(self.layers, key=self.order.get)
+        for name in names:
+            Overlay.draw(frame, self.layers.get(name, ()))
+        return frame
+
+    # 
+    # Primitives
+    # 
+
+    @staticmethod
+    def line(p1, p2, color, thickness=1): return ('line', p1, p2, color, thickness)
+
+    @staticmethod
+    def rect(p1, p2, color, thickness=1): return ('rect', p1, p2, color, thickness)
+
+    @staticmethod
+    def circle(center, radius, color, thickness=-1): return ('circle', center, radius, color, thickness)
+
+    @staticmethod
+    def text(text, org, color, scale=1.0, thickness=2): return ('text', text, org, color, scale, thickness)
+
+    @staticmethod
+    def tint(p1, p2, alpha=0.5): return ('tint', p1, p2, alpha) # blend white into a rectangle
+
+    @staticmethod
+    def draw(frame, primitives):
+        for primitive in primitives:
+            kind = primitive[0]
+            if kind == 'line':
+                _, p1, p2, color, thickness = primitive
+                cv2.line(frame, p1, p2, color, thickness)
+            elif kind == 'rect':
+                _, p1, p2, color, thickness = primitive
+                cv2.rectangle(frame, p1, p2, color, thickness)
+            elif kind == 'circle':
+                _, center, radius, color, thickness = primitive
+                cv2.circle(frame, center, radius, color, thickness)
+            elif kind == 'text':
+                _, text, org, color, scale, thickness = primitive
+                cv2.putText(frame, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+            elif kind == 'tint':
+                _, (x1, y1), (x2, y2), alpha = primitive
+                roi = frame[y1:y2, x1:x2]
+                if roi.size: cv2.addWeighted(roi, 1 - alpha, roi, 0, 255 * alpha, roi)
+        return frame
+
+    @staticmethod
+    def scale(primitives, factor):
+        """Primitives with their coordinates (and radii) multiplied by `factor`."""
+        point = lambda p: (int(round(p[0] * factor)), int(round(p[1] * factor)))
+        scaled = []
+        for primitive in primitives:
+            kind = primitive[0]
+            if kind in ('line', 'rect', 'tint'):
+                scaled.append((kind, point(primitive[1]), point(primitive[2]), *primitive[3:]))
+            elif kind == 'circle':
+                scaled.append((kind, point(primitive[1]), max(1, int(round(primitive[2] * factor))), *primitive[3:]))
+            elif kind == 'text':
+                scaled.append((kind, primitive[1], point(primitive[2]), *primitive[3:]))
+        return scaled
@@ -0,0 +1,95 @@
+#
+# Imports
+#
+
+import sys, os; sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+import threading
+import time
+import traceback
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from config.settings import MAIN_LOOP_RATE, debug
+
+#
+# The "PipelineBridge" class
+#
+
+class PipelineBridge(QObject):
+    """
+    Forwards FramePipeline progress to the GUI thread as Qt signals: a frame
+    id (`frameCaptured(seq)`) when the capture thread has a new frame, and
+    the frame id with its stage timestamps (`frameTracked(seq, stamps)`) when
+    the control stage is done with it. Signals are emitted from the pipeline
+    threads and delivered queued on the GUI thread. Each signal has at most
+    one delivery in flight: if the GUI has not handled the last one, newer
+    frames are not queued behind it, the slot just reads the newest state.
+    """
+
+    frameCaptured = pyqtSignal(int)
+    frameTracked = pyqtSignal(int, object)
+
+    def __init__(self, pipeline, parent=None):
+        super().__init__(parent)
+        self.pipeline = pipeline
+        self.lock = threading.Lock()
+        self.in_flight = {'capture': False, 'control': False}
+        self.stats = {'emitted': 0, 'coalesced': 0}
+        pipeline.add_stage_listener(self.on_stage)
+
+    def on_stage(self, stage, packet):
+        # pipeline thread
+        if stage not in self.in_flight: return
+        with self.lock:
+            if self.in_flight[stage]:
+                self.stats['coalesced'] += 1
+                return
+            self.in_flight[stage] = True
+            self.stats['emitted'] += 1
+
+        if stage == "capture": self.frameCaptured.emit(packet.seq)
+        else:                  self.frameTracked.emit(packet.seq, dict(packet.stamps))
+
+    def done(self, stage):
+        """Called by the receiving slot (GUI thread) once it handled the signal of `stage`."""
+        with self.lock: self.in_flight[stage] = False
+
+#
+# The "LoopWorker" class
+#
+
+class LoopWorker(QThread):
+    """
+    Runs `guide.loop()` and `controller.loop()` every `interval` milliseconds
+    in its own QThread, so steering and rc commands keep their cadence while
+    the GUI thread paints or handles input. Errors are reported through
+    `failed(message)` (shown in the status line) and the loop goes on;
+    `stop()` ends it.
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, guide, controller, interval=MAIN_LOOP_RATE, parent=None):
+        super().__init__(parent)
+        self.guide = guide
+        self.controller = controller
+        self.interval = interval / 1000
+        self.stats = {'ticks': 0, 'errors': 0}
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            started = time.time()
+            try:
+                self.guide.loop()
+                self.controller.loop()
+            except Exception as e:
+                self.stats['errors'] += 1
+                print("[ERR] Control loop failed:", e)
+                if debug: traceback.print_exc()
+                self.failed.emit(str(e))
+            self.stats['ticks'] += 1
+
+            remaining = self.interval - (time.time() - started)
+            if remaining > 0: time.sleep(remaining)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait(1000)